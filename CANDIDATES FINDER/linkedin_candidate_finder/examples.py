@@ -14,6 +14,18 @@ from linkedin_candidate_finder import (
 from utilities import CandidateExporter, BatchSearchManager, CandidateFilter
 
 
+# Enrichments shared by several examples
+ENRICH_LINKEDIN = EnrichmentConfig("Find LinkedIn profile")
+ENRICH_LINKEDIN_GITHUB = EnrichmentConfig("Find LinkedIn and GitHub profiles")
+
+# Enrichments shared by the engineering roles in the team batch search
+ENGINEERING_ENRICHMENTS = [
+    ENRICH_LINKEDIN_GITHUB,
+    EnrichmentConfig("Extract current company and role"),
+    EnrichmentConfig("List technical skills and expertise")
+]
+
+
 # ============================================================================
 # TECH RECRUITING EXAMPLES
 # ============================================================================
@@ -104,7 +116,7 @@ def find_frontend_engineers_react():
     )
     
     enrichments = [
-        EnrichmentConfig("Find LinkedIn and GitHub profiles"),
+        ENRICH_LINKEDIN_GITHUB,
         EnrichmentConfig("Extract current/most recent company and role"),
         EnrichmentConfig("List specific technologies and frameworks they've used"),
         EnrichmentConfig("Identify any notable projects or open source contributions")
@@ -134,7 +146,7 @@ def find_devops_kubernetes_experts():
     )
     
     enrichments = [
-        EnrichmentConfig("Find LinkedIn profile"),
+        ENRICH_LINKEDIN,
         EnrichmentConfig("Extract current role, company, and years of experience"),
         EnrichmentConfig("List their cloud platforms and DevOps tools expertise"),
         EnrichmentConfig("Identify certifications (CKA, AWS, etc.) if mentioned")
@@ -203,7 +215,7 @@ def find_growth_marketing_managers():
     )
     
     enrichments = [
-        EnrichmentConfig("Find LinkedIn profile"),
+        ENRICH_LINKEDIN,
         EnrichmentConfig("Extract current company, role, and marketing channels expertise"),
         EnrichmentConfig("Identify key metrics or growth achievements mentioned"),
         EnrichmentConfig("List marketing tools and platforms they've used")
@@ -370,7 +382,7 @@ def find_healthcare_product_managers():
     )
     
     enrichments = [
-        EnrichmentConfig("Find LinkedIn profile"),
+        ENRICH_LINKEDIN,
         EnrichmentConfig("Extract current company, role, and healthcare focus area"),
         EnrichmentConfig("Identify specific healthcare products they've worked on"),
         EnrichmentConfig("List relevant healthcare domain expertise")
@@ -400,7 +412,7 @@ def find_blockchain_developers():
     )
     
     enrichments = [
-        EnrichmentConfig("Find LinkedIn and GitHub profiles"),
+        ENRICH_LINKEDIN_GITHUB,
         EnrichmentConfig("Extract blockchain platforms and protocols they've worked with"),
         EnrichmentConfig("Identify any notable DeFi projects or smart contracts"),
         EnrichmentConfig("List programming languages and blockchain tools expertise")
@@ -423,13 +435,6 @@ def run_full_engineering_team_search():
     finder = LinkedInCandidateFinder()
     batch = BatchSearchManager(finder)
     
-    # Define common enrichments
-    standard_enrichments = [
-        EnrichmentConfig("Find LinkedIn and GitHub profiles"),
-        EnrichmentConfig("Extract current company and role"),
-        EnrichmentConfig("List technical skills and expertise")
-    ]
-    
     # Backend Engineers
     batch.add_search(
         name="backend-engineers",
@@ -442,7 +447,7 @@ def run_full_engineering_team_search():
                 "Currently employed"
             ]
         ),
-        enrichments=standard_enrichments
+        enrichments=ENGINEERING_ENRICHMENTS
     )
     
     # Frontend Engineers
@@ -457,7 +462,7 @@ def run_full_engineering_team_search():
                 "Currently employed"
             ]
         ),
-        enrichments=standard_enrichments
+        enrichments=ENGINEERING_ENRICHMENTS
     )
     
     # DevOps Engineers
@@ -472,7 +477,7 @@ def run_full_engineering_team_search():
                 "Currently employed"
             ]
         ),
-        enrichments=standard_enrichments
+        enrichments=ENGINEERING_ENRICHMENTS
     )
     
     # Engineering Managers
@@ -488,7 +493,7 @@ def run_full_engineering_team_search():
             ]
         ),
         enrichments=[
-            EnrichmentConfig("Find LinkedIn profile"),
+            ENRICH_LINKEDIN,
             EnrichmentConfig("Extract team size and management experience"),
             EnrichmentConfig("Identify technical background")
         ]
@@ -504,6 +509,23 @@ def run_full_engineering_team_search():
     return batch.get_all_results()
 
 
+# Menu entries in display order: (label, example function)
+EXAMPLES = (
+    ("Senior ML Engineers", find_senior_ml_engineers),
+    ("Frontend Engineers", find_frontend_engineers_react),
+    ("DevOps Engineers", find_devops_kubernetes_experts),
+    ("Enterprise AEs", find_enterprise_account_executives),
+    ("Growth Marketing", find_growth_marketing_managers),
+    ("VP Engineering", find_vp_engineering_candidates),
+    ("Fintech CTOs", find_ctos_fintech),
+    ("NLP PhDs", find_phd_candidates_nlp),
+    ("CV Research Scientists", find_research_scientists_computer_vision),
+    ("Healthcare PMs", find_healthcare_product_managers),
+    ("Blockchain Devs", find_blockchain_developers),
+    ("Full Team", run_full_engineering_team_search),
+)
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
@@ -511,6 +533,17 @@ def run_full_engineering_team_search():
 if __name__ == "__main__":
     import sys
     import os
+    import logging
+    
+    # Full tracebacks are only formatted when JUICEBOX_DEBUG is set. Only this
+    # module's logger is configured, so the SDK and HTTP libraries stay quiet
+    logger = logging.getLogger("examples")
+    if os.getenv("JUICEBOX_DEBUG"):
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(logging.StreamHandler())
+        logger.propagate = False
+    else:
+        logger.setLevel(logging.WARNING)
     
     if not os.getenv('EXA_API_KEY'):
         print("❌ Error: EXA_API_KEY not set")
@@ -550,23 +583,8 @@ if __name__ == "__main__":
     
     choice = input("\nSelect an example (1-12): ").strip()
     
-    examples = {
-        "1": ("Senior ML Engineers", find_senior_ml_engineers),
-        "2": ("Frontend Engineers", find_frontend_engineers_react),
-        "3": ("DevOps Engineers", find_devops_kubernetes_experts),
-        "4": ("Enterprise AEs", find_enterprise_account_executives),
-        "5": ("Growth Marketing", find_growth_marketing_managers),
-        "6": ("VP Engineering", find_vp_engineering_candidates),
-        "7": ("Fintech CTOs", find_ctos_fintech),
-        "8": ("NLP PhDs", find_phd_candidates_nlp),
-        "9": ("CV Research Scientists", find_research_scientists_computer_vision),
-        "10": ("Healthcare PMs", find_healthcare_product_managers),
-        "11": ("Blockchain Devs", find_blockchain_developers),
-        "12": ("Full Team", run_full_engineering_team_search),
-    }
-    
-    if choice in examples:
-        name, func = examples[choice]
+    if choice.isdigit() and 1 <= int(choice) <= len(EXAMPLES):
+        name, func = EXAMPLES[int(choice) - 1]
         print(f"\n{'='*60}")
         print(f"Running: {name}")
         print(f"{'='*60}\n")
@@ -585,7 +603,6 @@ if __name__ == "__main__":
             print("\n\n⚠️  Search interrupted by user")
         except Exception as e:
             print(f"\n❌ Error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("Example %s failed", name, exc_info=True)
     else:
         print("❌ Invalid choice")
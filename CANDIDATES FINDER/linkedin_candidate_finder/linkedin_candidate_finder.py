@@ -7,18 +7,23 @@ the results with additional information.
 """
 
 import os
+import sys
 import time
 import json
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+import asyncio
+import operator
+from typing import Optional, List, Dict, Any, Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 
 try:
-    from exa_py import Exa
-    from exa_py.websets.types import CreateWebsetParameters, CreateEnrichmentParameters
-except ImportError:
-    print("Please install exa_py: pip install exa_py")
-    exit(1)
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
+from rate_limiter import RateLimiter, call_with_rate_limit
 
 
 class EntityType(str, Enum):
@@ -27,24 +32,88 @@ class EntityType(str, Enum):
     COMPANY = "company"
     RESEARCH_PAPER = "research_paper"
     ARTICLE = "article"
+    
+    @cached_property
+    def payload(self) -> Dict[str, str]:
+        """Search entity payload, built once per member and shared read-only"""
+        return {"type": self.value}
+
+
+# slots=True needs Python 3.10+; older interpreters still get frozen instances
+_DATACLASS_OPTIONS: Dict[str, bool] = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS['slots'] = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SearchCriteria:
     """Defines search criteria for finding candidates"""
     query: str
     count: int = 10
     entity: EntityType = EntityType.PERSON
-    criteria: Optional[List[str]] = None
-    exclude_criteria: Optional[List[str]] = None
+    criteria: Sequence[str] = ()
+    exclude_criteria: Sequence[str] = ()
     
+    def __post_init__(self):
+        # Store criteria as tuples so instances stay immutable and hashable
+        object.__setattr__(self, 'criteria', tuple(self.criteria or ()))
+        object.__setattr__(self, 'exclude_criteria', tuple(self.exclude_criteria or ()))
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class EnrichmentConfig:
     """Configuration for enriching candidate data"""
     description: str
     format: str = "text"  # or "json"
-    schema: Optional[Dict] = None
+    schema: Optional[Dict] = field(default=None, compare=False)
+    # Canonical JSON of schema, computed once; it keys the enrichment params
+    # cache and stands in for the unhashable dict in equality and hashing
+    schema_json: str = field(init=False, repr=False, default='')
+    
+    def __post_init__(self):
+        if self.schema:
+            object.__setattr__(self, 'schema_json', json.dumps(self.schema, sort_keys=True))
+
+
+# Attributes every webset item has, fetched with a single C-level call
+_item_required_fields = operator.attrgetter('id', 'url', 'status')
+
+
+@lru_cache(maxsize=None)
+def get_default_client(api_key: str) -> Any:
+    """
+    Return the shared Exa client for an API key.
+    
+    Finders created with the same key reuse one client, and with it one
+    HTTP connection pool, instead of opening new connections per finder.
+    """
+    # exa_py is imported on first use so that importing this module
+    # (e.g. just for SearchCriteria/EnrichmentConfig) stays cheap
+    try:
+        from exa_py import Exa
+    except ImportError as e:
+        raise ImportError("Please install exa_py: pip install exa_py") from e
+    
+    return Exa(api_key)
+
+
+@lru_cache(maxsize=256)
+def _enrichment_params(description: str, format: str, schema_json: str) -> Any:
+    """
+    Build (and memoize) the Exa parameters for one enrichment.
+    
+    Repeated enrichment templates reuse the same validated parameters
+    object instead of constructing a new one per search.
+    """
+    from exa_py.websets.types import CreateEnrichmentParameters
+    
+    params = CreateEnrichmentParameters(
+        description=description,
+        format=format
+    )
+    if schema_json:
+        params.schema = json.loads(schema_json)
+    return params
 
 
 class LinkedInCandidateFinder:
@@ -58,12 +127,14 @@ class LinkedInCandidateFinder:
     - Monitor for new candidates matching your criteria
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[Any] = None):
         """
         Initialize the LinkedIn Candidate Finder.
         
         Args:
             api_key: Your Exa API key. If not provided, reads from EXA_API_KEY env var.
+            client: An existing Exa client to use. Defaults to the shared client
+                for the API key (see get_default_client).
         """
         self.api_key = api_key or os.getenv('EXA_API_KEY')
         if not self.api_key:
@@ -72,7 +143,7 @@ class LinkedInCandidateFinder:
                 "or pass api_key to constructor. Get your key at: https://dashboard.exa.ai/api-keys"
             )
         
-        self.exa = Exa(self.api_key)
+        self.exa = client or get_default_client(self.api_key)
         
     def create_candidate_search(
         self,
@@ -111,6 +182,8 @@ class LinkedInCandidateFinder:
             ... ]
             >>> webset = finder.create_candidate_search(criteria, enrichments)
         """
+        from exa_py.websets.types import CreateWebsetParameters
+        
         print(f"🔍 Creating candidate search: '{search_criteria.query}'")
         print(f"   Looking for {search_criteria.count} candidates...")
         
@@ -118,7 +191,7 @@ class LinkedInCandidateFinder:
         search_params = {
             "query": search_criteria.query,
             "count": search_criteria.count,
-            "entity": {"type": search_criteria.entity.value}
+            "entity": search_criteria.entity.payload
         }
         
         # Add criteria if provided
@@ -137,13 +210,9 @@ class LinkedInCandidateFinder:
         enrichment_params = []
         if enrichments:
             for enrich in enrichments:
-                params = CreateEnrichmentParameters(
-                    description=enrich.description,
-                    format=enrich.format
+                enrichment_params.append(
+                    _enrichment_params(enrich.description, enrich.format, enrich.schema_json)
                 )
-                if enrich.schema:
-                    params.schema = enrich.schema
-                enrichment_params.append(params)
         
         # Create the webset
         try:
@@ -207,6 +276,73 @@ class LinkedInCandidateFinder:
             print(f"❌ Error waiting for webset: {str(e)}")
             raise
     
+    def iter_candidates(
+        self,
+        webset_id: str,
+        limit: Optional[int] = None,
+        include_content: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over candidate results from a webset.
+        
+        Items are fetched a page at a time by following the list cursor, so
+        the first candidates are available before the whole webset is read.
+        The next page is requested in the background while the current one
+        is being consumed, overlapping its round trip with processing.
+        
+        Enrichment results are returned on each item by the same list call,
+        since enrichments are requested when the webset is created; no
+        per-candidate requests are made.
+        
+        Args:
+            webset_id: The ID of the webset
+            limit: Maximum number of candidates to retrieve
+            include_content: Whether to include full content
+            
+        Yields:
+            Candidate items with their information
+        """
+        def fetch_page(cursor: Optional[str], page_limit: Optional[int]) -> Any:
+            params = {"webset_id": webset_id, "limit": page_limit}
+            if cursor:
+                params["cursor"] = cursor
+            return self.exa.websets.items.list(**params)
+        
+        remaining = limit
+        
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            page = fetch_page(None, remaining)
+            
+            while True:
+                if remaining is not None:
+                    remaining -= len(page.data)
+                
+                next_page = None
+                cursor = getattr(page, 'next_cursor', None)
+                if getattr(page, 'has_more', False) and cursor and (remaining is None or remaining > 0):
+                    next_page = prefetcher.submit(fetch_page, cursor, remaining)
+                
+                for item in page.data:
+                    item_id, url, status = _item_required_fields(item)
+                    candidate_data = {
+                        "id": item_id,
+                        "url": url,
+                        "title": getattr(item, 'title', None),
+                        "status": status,
+                        "verification": getattr(item, 'verification', None),
+                        "properties": getattr(item, 'properties', {}),
+                        "enrichments": getattr(item, 'enrichments', [])
+                    }
+                    
+                    if include_content and hasattr(item, 'content'):
+                        candidate_data['content'] = item.content
+                        
+                    yield candidate_data
+                
+                if next_page is None:
+                    return
+                page = next_page.result()
+    
     def get_candidates(
         self,
         webset_id: str,
@@ -216,6 +352,9 @@ class LinkedInCandidateFinder:
         """
         Retrieve candidate results from a webset.
         
+        Collects iter_candidates into a list; use iter_candidates directly
+        to process candidates as pages arrive.
+        
         Args:
             webset_id: The ID of the webset
             limit: Maximum number of candidates to retrieve
@@ -227,27 +366,7 @@ class LinkedInCandidateFinder:
         print(f"📋 Fetching candidates from webset {webset_id}...")
         
         try:
-            items = self.exa.websets.items.list(
-                webset_id=webset_id,
-                limit=limit
-            )
-            
-            candidates = []
-            for item in items.data:
-                candidate_data = {
-                    "id": item.id,
-                    "url": item.url,
-                    "title": getattr(item, 'title', None),
-                    "status": item.status,
-                    "verification": getattr(item, 'verification', None),
-                    "properties": getattr(item, 'properties', {}),
-                    "enrichments": getattr(item, 'enrichments', [])
-                }
-                
-                if include_content and hasattr(item, 'content'):
-                    candidate_data['content'] = item.content
-                    
-                candidates.append(candidate_data)
+            candidates = list(self.iter_candidates(webset_id, limit, include_content))
             
             print(f"✅ Retrieved {len(candidates)} candidates")
             
@@ -290,6 +409,111 @@ class LinkedInCandidateFinder:
         # Get and return results
         return self.get_candidates(webset_info['id'])
     
+    async def _call_async(
+        self,
+        func: Callable[..., Any],
+        *args,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 3,
+        **kwargs
+    ) -> Any:
+        """
+        Run a blocking SDK call in a worker thread.
+        
+        With a rate_limiter, each attempt waits for a token first, and calls
+        rejected with HTTP 429 are retried up to max_retries times.
+        """
+        if rate_limiter is None:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return await call_with_rate_limit(
+            rate_limiter, func, *args, max_retries=max_retries, **kwargs
+        )
+    
+    async def wait_for_results_async(
+        self,
+        webset_id: str,
+        timeout: int = 3600,
+        initial_interval: float = 1,
+        max_interval: float = 30,
+        rate_limiter: Optional[RateLimiter] = None
+    ) -> Any:
+        """
+        Async version of wait_for_results.
+        
+        Polls the webset status and sleeps on the event loop between checks,
+        so several searches can wait concurrently without blocking threads.
+        The delay between checks doubles after every poll, so short searches
+        are picked up quickly and long ones are not polled needlessly.
+        
+        Args:
+            webset_id: The ID of the webset to wait for
+            timeout: Maximum time to wait in seconds (default: 1 hour)
+            initial_interval: Seconds to wait after the first status check
+            max_interval: Upper bound for the delay between checks
+            rate_limiter: Optional shared limiter for the status requests
+            
+        Returns:
+            The completed webset information
+        """
+        print(f"⏳ Waiting for webset {webset_id} to complete...")
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = initial_interval
+        
+        while True:
+            webset = await self._call_async(
+                self.exa.websets.get, webset_id, rate_limiter=rate_limiter
+            )
+            if webset.status == "idle":
+                print(f"✅ Webset {webset_id} processing complete!")
+                return webset
+            
+            if loop.time() >= deadline:
+                raise TimeoutError(
+                    f"Webset {webset_id} did not finish within {timeout} seconds"
+                )
+            
+            await asyncio.sleep(min(delay, max(deadline - loop.time(), 0)))
+            delay = min(delay * 2, max_interval)
+    
+    async def search_and_wait_async(
+        self,
+        search_criteria: SearchCriteria,
+        enrichments: Optional[List[EnrichmentConfig]] = None,
+        external_id: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of search_and_wait.
+        
+        Blocking SDK calls run in worker threads and polling waits yield the
+        event loop, so independent searches can be awaited together with
+        asyncio.gather.
+        
+        Args:
+            search_criteria: What candidates you're looking for
+            enrichments: Additional data to extract
+            external_id: Your own identifier
+            rate_limiter: Optional limiter shared with other concurrent searches
+            
+        Returns:
+            List of candidate results
+        """
+        webset_info = await self._call_async(
+            self.create_candidate_search,
+            search_criteria=search_criteria,
+            enrichments=enrichments,
+            external_id=external_id,
+            rate_limiter=rate_limiter
+        )
+        
+        await self.wait_for_results_async(webset_info['id'], rate_limiter=rate_limiter)
+        
+        return await self._call_async(
+            self.get_candidates, webset_info['id'], rate_limiter=rate_limiter
+        )
+    
     def get_webset_status(self, webset_id: str) -> Dict[str, Any]:
         """
         Check the status of a webset.
@@ -310,23 +534,23 @@ class LinkedInCandidateFinder:
             }
             
             # Get search progress if available
-            if hasattr(webset, 'searches') and webset.searches:
-                for search in webset.searches:
-                    search_info = {
-                        "id": search.id,
-                        "status": search.status,
-                        "query": search.query
+            for search in getattr(webset, 'searches', None) or ():
+                search_info = {
+                    "id": search.id,
+                    "status": search.status,
+                    "query": search.query
+                }
+                
+                progress = getattr(search, 'progress', None)
+                if progress is not None:
+                    search_info["progress"] = {
+                        "found": progress.found,
+                        "analyzed": progress.analyzed,
+                        "completion": progress.completion,
+                        "time_left": progress.timeLeft
                     }
-                    
-                    if hasattr(search, 'progress'):
-                        search_info["progress"] = {
-                            "found": search.progress.found,
-                            "analyzed": search.progress.analyzed,
-                            "completion": search.progress.completion,
-                            "time_left": search.progress.timeLeft
-                        }
-                    
-                    status_info["searches"].append(search_info)
+                
+                status_info["searches"].append(search_info)
             
             return status_info
             
@@ -365,7 +589,7 @@ class LinkedInCandidateFinder:
 
 
 # Example usage and templates
-def example_ml_engineer_search():
+async def example_ml_engineer_search_async(rate_limiter: Optional[RateLimiter] = None):
     """Example: Finding ML Engineers at AI startups"""
     finder = LinkedInCandidateFinder()
     
@@ -400,16 +624,17 @@ def example_ml_engineer_search():
         )
     ]
     
-    results = finder.search_and_wait(
+    results = await finder.search_and_wait_async(
         search_criteria=criteria,
         enrichments=enrichments,
-        external_id="ml-engineers-2024"
+        external_id="ml-engineers-2024",
+        rate_limiter=rate_limiter
     )
     
     return results
 
 
-def example_sales_leader_search():
+async def example_sales_leader_search_async(rate_limiter: Optional[RateLimiter] = None):
     """Example: Finding Sales Leaders in SaaS"""
     finder = LinkedInCandidateFinder()
     
@@ -440,16 +665,17 @@ def example_sales_leader_search():
         )
     ]
     
-    results = finder.search_and_wait(
+    results = await finder.search_and_wait_async(
         search_criteria=criteria,
         enrichments=enrichments,
-        external_id="saas-sales-leaders"
+        external_id="saas-sales-leaders",
+        rate_limiter=rate_limiter
     )
     
     return results
 
 
-def example_phd_candidate_search():
+async def example_phd_candidate_search_async(rate_limiter: Optional[RateLimiter] = None):
     """Example: Finding PhD candidates for research positions"""
     finder = LinkedInCandidateFinder()
     
@@ -484,15 +710,47 @@ def example_phd_candidate_search():
         )
     ]
     
-    results = finder.search_and_wait(
+    results = await finder.search_and_wait_async(
         search_criteria=criteria,
         enrichments=enrichments,
-        external_id="nlp-phd-candidates"
+        external_id="nlp-phd-candidates",
+        rate_limiter=rate_limiter
     )
     
     return results
 
 
+def example_ml_engineer_search():
+    """Example: Finding ML Engineers at AI startups (blocking; see the _async variant)"""
+    return asyncio.run(example_ml_engineer_search_async())
+
+
+def example_sales_leader_search():
+    """Example: Finding Sales Leaders in SaaS (blocking; see the _async variant)"""
+    return asyncio.run(example_sales_leader_search_async())
+
+
+def example_phd_candidate_search():
+    """Example: Finding PhD candidates for research positions (blocking; see the _async variant)"""
+    return asyncio.run(example_phd_candidate_search_async())
+
+
+async def run_example_searches() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Run all example searches concurrently.
+    
+    The searches are independent, so their polling waits overlap and the
+    total wall-clock time is that of the slowest search rather than the sum.
+    """
+    rate_limiter = RateLimiter()
+    ml, sales, phd = await asyncio.gather(
+        example_ml_engineer_search_async(rate_limiter),
+        example_sales_leader_search_async(rate_limiter),
+        example_phd_candidate_search_async(rate_limiter)
+    )
+    return {'ml_engineers': ml, 'sales_leaders': sales, 'phd_candidates': phd}
+
+
 if __name__ == "__main__":
     import sys
     
@@ -514,8 +772,9 @@ if __name__ == "__main__":
     print("2. Find Sales Leaders in SaaS")
     print("3. Find PhD Candidates in NLP")
     print("4. Custom search")
+    print("5. Run examples 1-3 concurrently")
     
-    choice = input("\nSelect an example (1-4): ").strip()
+    choice = input("\nSelect an example (1-5): ").strip()
     
     try:
         if choice == "1":
@@ -554,6 +813,15 @@ if __name__ == "__main__":
                     EnrichmentConfig("Extract current role and company")
                 ]
             )
+        elif choice == "5":
+            print("\n" + "="*60)
+            print("Running all examples concurrently")
+            print("="*60)
+            grouped = asyncio.run(run_example_searches())
+            for label, group in grouped.items():
+                print(f"   {label}: {len(group)} candidates")
+            results = [c for group in grouped.values() for c in group]
+            
         else:
             print("Invalid choice")
             sys.exit(1)
@@ -569,7 +837,11 @@ if __name__ == "__main__":
             print(f"   Status: {candidate.get('status')}")
             
             if candidate.get('properties'):
-                print(f"   Properties: {json.dumps(candidate['properties'], indent=6)}")
+                if orjson is not None:
+                    properties = orjson.dumps(candidate['properties'], option=orjson.OPT_INDENT_2).decode()
+                else:
+                    properties = json.dumps(candidate['properties'], indent=6)
+                print(f"   Properties: {properties}")
             
             if candidate.get('enrichments'):
                 print(f"   Enrichments: {len(candidate['enrichments'])} available")
@@ -578,8 +850,12 @@ if __name__ == "__main__":
         save = input("\n💾 Save results to file? (y/n): ").strip().lower()
         if save == 'y':
             filename = f"candidates_{int(time.time())}.json"
-            with open(filename, 'w') as f:
-                json.dump(results, f, indent=2)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(results, f, indent=2)
             print(f"✅ Results saved to {filename}")
             
     except KeyboardInterrupt:
@@ -1,15 +1,70 @@
 """
 Candidates API routes
 """
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from functools import lru_cache
 from typing import List, Optional
+import hashlib
+import os
 
-from app.models.schemas import Candidate, CandidateListResponse
+import orjson
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.utilities import CandidateExporter
+from app.models.schemas import Candidate, CandidateListResponse, CandidateProperties
 from app.services.search_service import search_service
 
 router = APIRouter(prefix="/candidates", tags=["candidates"])
 
 
+@lru_cache(maxsize=1)
+def _candidate_list_cache() -> TTLCache:
+    """Encoded candidate list bodies keyed by data version and query parameters"""
+    return TTLCache(maxsize=256, ttl=get_settings().CACHE_TTL)
+
+
+# Number of NDJSON lines written per chunk by the streaming endpoint
+_STREAM_BATCH_SIZE = 50
+
+# Columns of the CSV export, in order
+_CSV_EXPORT_FIELDS = [
+    'id', 'url', 'title', 'status', 'score',
+    *(f'property_{name}' for name in CandidateProperties.model_fields),
+]
+
+# Per-process salt so ETags from a previous server run never match after a restart
+_ETAG_SALT = os.urandom(8)
+
+
+def _make_etag(cache_key: tuple) -> str:
+    """Build a strong ETag for a candidate list cache key"""
+    digest = hashlib.blake2b(
+        repr(cache_key).encode(), digest_size=16, salt=_ETAG_SALT
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+async def _get_filtered_candidates(
+    search_id: Optional[str],
+    min_score: Optional[float],
+    verified_only: bool
+) -> List[Candidate]:
+    """Fetch candidates for the streaming endpoints, reporting failures as a 500"""
+    try:
+        return await search_service.get_candidates(
+            search_id,
+            min_score=min_score,
+            verified_only=verified_only
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve candidates: {str(e)}"
+        )
+
+
 @router.get(
     "",
     response_model=CandidateListResponse,
@@ -17,9 +72,12 @@ router = APIRouter(prefix="/candidates", tags=["candidates"])
     description="Retrieve all candidates from all searches or from a specific search"
 )
 async def get_candidates(
+    request: Request,
     search_id: Optional[str] = Query(None, description="Filter by search ID"),
     min_score: Optional[float] = Query(None, ge=0, le=100, description="Minimum score filter"),
-    verified_only: Optional[bool] = Query(False, description="Only return verified candidates")
+    verified_only: Optional[bool] = Query(False, description="Only return verified candidates"),
+    limit: Optional[int] = Query(None, ge=1, description="Only return the top N candidates by score"),
+    compact: bool = Query(False, description="Omit null and default-valued fields")
 ):
     """
     Get all candidates with optional filters.
@@ -27,32 +85,141 @@ async def get_candidates(
     - **search_id**: (Optional) Only return candidates from this search
     - **min_score**: (Optional) Only return candidates with score >= this value
     - **verified_only**: (Optional) Only return candidates that passed verification
+    - **limit**: (Optional) Only return the top N candidates by score
+    - **compact**: (Optional) Leave out null, empty and default-valued fields;
+      clients must treat a missing field as its default
 
     Returns a list of candidates sorted by score (highest first).
+    Responses carry an ETag; send it back in If-None-Match to get a 304
+    while the underlying search data is unchanged.
     """
-    try:
-        candidates = await search_service.get_candidates(search_id)
+    cache_key = (search_service.data_version, search_id, min_score, verified_only, limit, compact)
+    etag = _make_etag(cache_key)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = _candidate_list_cache().get(cache_key)
+    if body is None:
+        try:
+            candidates = await search_service.get_candidates(
+                search_id,
+                min_score=min_score,
+                verified_only=verified_only,
+                limit=limit
+            )
+
+            # Candidates are already validated models; encode them directly
+            # instead of letting FastAPI re-validate the response model
+            body = CandidateListResponse(
+                total=len(candidates),
+                candidates=candidates
+            ).model_dump_json(exclude_none=compact, exclude_defaults=compact).encode()
+            _candidate_list_cache().set(cache_key, body)
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to retrieve candidates: {str(e)}"
+            )
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
-        # Apply filters
-        if min_score is not None:
-            candidates = [c for c in candidates if c.score and c.score >= min_score]
 
-        if verified_only:
-            candidates = [
-                c for c in candidates
-                if c.verification and c.verification.passed
-            ]
+@router.get(
+    "/stream",
+    summary="Stream candidates",
+    description="Stream candidates as newline-delimited JSON (one candidate per line)"
+)
+async def stream_candidates(
+    search_id: Optional[str] = Query(None, description="Filter by search ID"),
+    min_score: Optional[float] = Query(None, ge=0, le=100, description="Minimum score filter"),
+    verified_only: Optional[bool] = Query(False, description="Only return verified candidates"),
+    compact: bool = Query(False, description="Omit null and default-valued fields")
+):
+    """
+    Stream candidates with optional filters as NDJSON.
 
-        return CandidateListResponse(
-            total=len(candidates),
-            candidates=candidates
-        )
+    Accepts the same filters and compact option as the list endpoint.
+    Candidates are serialized and sent in batches, so large result sets are
+    never encoded as one blob.
+    """
+    candidates = await _get_filtered_candidates(search_id, min_score, verified_only)
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve candidates: {str(e)}"
-        )
+    async def _iter_ndjson():
+        batch = []
+        for candidate in candidates:
+            batch.append(orjson.dumps(
+                candidate.model_dump(exclude_none=compact, exclude_defaults=compact)
+            ))
+            if len(batch) >= _STREAM_BATCH_SIZE:
+                yield b"\n".join(batch) + b"\n"
+                batch.clear()
+        if batch:
+            yield b"\n".join(batch) + b"\n"
+
+    return StreamingResponse(_iter_ndjson(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/export.csv",
+    summary="Export candidates as CSV",
+    description="Download candidates as a CSV file, streamed in chunks"
+)
+async def export_candidates_csv(
+    search_id: Optional[str] = Query(None, description="Filter by search ID"),
+    min_score: Optional[float] = Query(None, ge=0, le=100, description="Minimum score filter"),
+    verified_only: Optional[bool] = Query(False, description="Only return verified candidates")
+):
+    """
+    Export candidates with optional filters as CSV.
+
+    Rows are encoded as the response is sent, so memory use is bounded by
+    the chunk size rather than the number of candidates.
+    """
+    candidates = await _get_filtered_candidates(search_id, min_score, verified_only)
+
+    rows = (candidate.model_dump(mode="json") for candidate in candidates)
+    return StreamingResponse(
+        CandidateExporter.iter_csv(rows, _CSV_EXPORT_FIELDS, chunk_size=_STREAM_BATCH_SIZE),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="candidates.csv"'}
+    )
+
+
+@router.get(
+    "/export.json",
+    summary="Export candidates as JSON",
+    description="Download candidates as a JSON array, streamed in chunks"
+)
+async def export_candidates_json(
+    search_id: Optional[str] = Query(None, description="Filter by search ID"),
+    min_score: Optional[float] = Query(None, ge=0, le=100, description="Minimum score filter"),
+    verified_only: Optional[bool] = Query(False, description="Only return verified candidates")
+):
+    """
+    Export candidates with optional filters as a JSON array.
+
+    Accepts the same filters as the list endpoint.
+    """
+    candidates = await _get_filtered_candidates(search_id, min_score, verified_only)
+
+    async def _iter_json_array():
+        yield b"["
+        for start in range(0, len(candidates), _STREAM_BATCH_SIZE):
+            batch = b",".join(
+                orjson.dumps(candidate.model_dump())
+                for candidate in candidates[start:start + _STREAM_BATCH_SIZE]
+            )
+            yield batch if start == 0 else b"," + batch
+        yield b"]"
+
+    return StreamingResponse(
+        _iter_json_array(),
+        media_type="application/json",
+        headers={"Content-Disposition": 'attachment; filename="candidates.json"'}
+    )
 
 
 @router.get(
@@ -69,10 +236,7 @@ async def get_candidate(candidate_id: str):
 
     Returns detailed candidate information including verification, properties, and enrichments.
     """
-    # Get all candidates and find the matching one
-    all_candidates = await search_service.get_candidates()
-
-    candidate = next((c for c in all_candidates if c.id == candidate_id), None)
+    candidate = await search_service.get_candidate_by_id(candidate_id)
 
     if not candidate:
         raise HTTPException(
@@ -1,9 +1,10 @@
 """
 Configuration settings for Juicebox AI Backend
 """
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 import os
 import sys
 
@@ -11,6 +12,13 @@ import sys
 class Settings(BaseSettings):
     """Application settings"""
 
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        frozen=True,
+        extra="ignore",
+    )
+
     # API Settings
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Juicebox AI"
@@ -23,18 +31,23 @@ class Settings(BaseSettings):
     DEBUG: bool = True
 
     # CORS Settings
-    BACKEND_CORS_ORIGINS: list = [
+    BACKEND_CORS_ORIGINS: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:5173",  # Vite default port
         "http://127.0.0.1:3000",
         "http://127.0.0.1:5173",
-    ]
+    )
 
     # Exa API Settings
     EXA_API_KEY: str
     EXA_TIMEOUT: int = 3600  # 1 hour
     EXA_MAX_RETRIES: int = 3
-    EXA_CHECK_INTERVAL: int = 10
+    # Worker threads for blocking Exa SDK calls, and searches run at once
+    EXA_MAX_CONCURRENCY: int = 8
+    # Status polling backoff: first delay, growth factor and cap (seconds)
+    EXA_CHECK_INTERVAL_INITIAL: float = 0.5
+    EXA_CHECK_INTERVAL_MULTIPLIER: float = 1.7
+    EXA_CHECK_INTERVAL_MAX: float = 60
 
     # Search Settings
     DEFAULT_CANDIDATE_COUNT: int = 10
@@ -61,19 +74,22 @@ class Settings(BaseSettings):
             sys.exit(1)
         return v
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the application settings, loading them on first use.
 
-# Create global settings instance with helpful error handling
-try:
-    settings = Settings()
-except Exception as e:
-    print("\n" + "="*70)
-    print("ERROR: Failed to load configuration!")
-    print("="*70)
-    print(f"\n{str(e)}\n")
-    print("Please check your .env file and environment variables.")
-    print("="*70 + "\n")
-    sys.exit(1)
+    The instance is cached, so the .env file is parsed and validated once per
+    process. Use with FastAPI as ``Depends(get_settings)``.
+    """
+    try:
+        return Settings()
+    except Exception as e:
+        print("\n" + "="*70)
+        print("ERROR: Failed to load configuration!")
+        print("="*70)
+        print(f"\n{str(e)}\n")
+        print("Please check your .env file and environment variables.")
+        print("="*70 + "\n")
+        sys.exit(1)
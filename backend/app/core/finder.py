@@ -6,19 +6,22 @@ Websets allows you to search for people matching specific criteria and enriches
 the results with additional information.
 """
 
-import os
+import sys
 import time
 import json
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+import asyncio
+import logging
+import operator
+from typing import Optional, List, Dict, Any, Callable, Iterator, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 
-try:
-    from exa_py import Exa
-    from exa_py.websets.types import CreateWebsetParameters, CreateEnrichmentParameters
-except ImportError:
-    print("Please install exa_py: pip install exa_py")
-    exit(1)
+import orjson
+
+from app.core.config import get_settings
+from app.core.rate_limiter import RateLimiter, call_with_rate_limit
 
 
 class EntityType(str, Enum):
@@ -27,24 +30,104 @@ class EntityType(str, Enum):
     COMPANY = "company"
     RESEARCH_PAPER = "research_paper"
     ARTICLE = "article"
+    
+    @cached_property
+    def payload(self) -> Dict[str, str]:
+        """Search entity payload, built once per member and shared read-only"""
+        return {"type": self.value}
+
 
+# slots=True needs Python 3.10+; older interpreters still get frozen instances
+_DATACLASS_OPTIONS: Dict[str, bool] = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS['slots'] = True
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SearchCriteria:
     """Defines search criteria for finding candidates"""
     query: str
     count: int = 10
     entity: EntityType = EntityType.PERSON
-    criteria: Optional[List[str]] = None
-    exclude_criteria: Optional[List[str]] = None
+    criteria: Sequence[str] = ()
+    exclude_criteria: Sequence[str] = ()
     
+    def __post_init__(self):
+        # Store criteria as tuples so instances stay immutable and hashable
+        object.__setattr__(self, 'criteria', tuple(self.criteria or ()))
+        object.__setattr__(self, 'exclude_criteria', tuple(self.exclude_criteria or ()))
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class EnrichmentConfig:
     """Configuration for enriching candidate data"""
     description: str
     format: str = "text"  # or "json"
-    schema: Optional[Dict] = None
+    schema: Optional[Dict] = field(default=None, compare=False)
+    # Canonical JSON of schema, computed once; it keys the enrichment params
+    # cache and stands in for the unhashable dict in equality and hashing
+    schema_json: str = field(init=False, repr=False, default='')
+    
+    def __post_init__(self):
+        if self.schema:
+            object.__setattr__(self, 'schema_json', json.dumps(self.schema, sort_keys=True))
+
+
+logger = logging.getLogger(__name__)
+
+# Attributes every webset item has, fetched with a single C-level call
+_item_required_fields = operator.attrgetter('id', 'url', 'status')
+
+
+@lru_cache(maxsize=None)
+def get_default_client(api_key: str) -> Any:
+    """
+    Return the shared Exa client for an API key.
+    
+    Finders created with the same key reuse one client, and with it one
+    HTTP connection pool, instead of opening new connections per finder.
+    """
+    # exa_py is imported on first use so that importing this module
+    # (e.g. just for SearchCriteria/EnrichmentConfig) stays cheap
+    try:
+        from exa_py import Exa
+    except ImportError as e:
+        raise ImportError("Please install exa_py: pip install exa_py") from e
+    
+    return Exa(api_key)
+
+
+@lru_cache(maxsize=256)
+def _enrichment_params(description: str, format: str, schema_json: str) -> Any:
+    """
+    Build (and memoize) the Exa parameters for one enrichment.
+    
+    Repeated enrichment templates reuse the same validated parameters
+    object instead of constructing a new one per search.
+    """
+    from exa_py.websets.types import CreateEnrichmentParameters
+    
+    params = CreateEnrichmentParameters(
+        description=description,
+        format=format
+    )
+    if schema_json:
+        params.schema = json.loads(schema_json)
+    return params
+
+
+def _backoff_params(
+    initial_interval: Optional[float],
+    max_interval: Optional[float],
+    multiplier: Optional[float]
+) -> Tuple[float, float, float]:
+    """Fill unset polling backoff parameters from the app settings"""
+    settings = get_settings()
+    return (
+        settings.EXA_CHECK_INTERVAL_INITIAL if initial_interval is None else initial_interval,
+        settings.EXA_CHECK_INTERVAL_MAX if max_interval is None else max_interval,
+        settings.EXA_CHECK_INTERVAL_MULTIPLIER if multiplier is None else multiplier,
+    )
 
 
 class LinkedInCandidateFinder:
@@ -58,21 +141,23 @@ class LinkedInCandidateFinder:
     - Monitor for new candidates matching your criteria
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[Any] = None):
         """
         Initialize the LinkedIn Candidate Finder.
         
         Args:
-            api_key: Your Exa API key. If not provided, reads from EXA_API_KEY env var.
+            api_key: Your Exa API key. If not provided, uses EXA_API_KEY from the app settings.
+            client: An existing Exa client to use. Defaults to the shared client
+                for the API key (see get_default_client).
         """
-        self.api_key = api_key or os.getenv('EXA_API_KEY')
+        self.api_key = api_key or get_settings().EXA_API_KEY
         if not self.api_key:
             raise ValueError(
                 "Exa API key is required. Set EXA_API_KEY environment variable "
                 "or pass api_key to constructor. Get your key at: https://dashboard.exa.ai/api-keys"
             )
         
-        self.exa = Exa(self.api_key)
+        self.exa = client or get_default_client(self.api_key)
         
     def create_candidate_search(
         self,
@@ -111,14 +196,18 @@ class LinkedInCandidateFinder:
             ... ]
             >>> webset = finder.create_candidate_search(criteria, enrichments)
         """
-        print(f"🔍 Creating candidate search: '{search_criteria.query}'")
-        print(f"   Looking for {search_criteria.count} candidates...")
+        from exa_py.websets.types import CreateWebsetParameters
+        
+        logger.info(
+            "Creating candidate search: '%s' (looking for %d candidates)",
+            search_criteria.query, search_criteria.count
+        )
         
         # Build search parameters
         search_params = {
             "query": search_criteria.query,
             "count": search_criteria.count,
-            "entity": {"type": search_criteria.entity.value}
+            "entity": search_criteria.entity.payload
         }
         
         # Add criteria if provided
@@ -137,13 +226,9 @@ class LinkedInCandidateFinder:
         enrichment_params = []
         if enrichments:
             for enrich in enrichments:
-                params = CreateEnrichmentParameters(
-                    description=enrich.description,
-                    format=enrich.format
+                enrichment_params.append(
+                    _enrichment_params(enrich.description, enrich.format, enrich.schema_json)
                 )
-                if enrich.schema:
-                    params.schema = enrich.schema
-                enrichment_params.append(params)
         
         # Create the webset
         try:
@@ -156,9 +241,7 @@ class LinkedInCandidateFinder:
                 )
             )
             
-            print(f"✅ Webset created successfully!")
-            print(f"   Webset ID: {webset.id}")
-            print(f"   Status: {webset.status}")
+            logger.info("Webset %s created (status: %s)", webset.id, webset.status)
             
             return {
                 "id": webset.id,
@@ -168,45 +251,129 @@ class LinkedInCandidateFinder:
             }
             
         except Exception as e:
-            print(f"❌ Error creating webset: {str(e)}")
+            logger.error("Error creating webset: %s", e)
             raise
     
     def wait_for_results(
         self,
         webset_id: str,
         timeout: int = 3600,
-        check_interval: int = 10
+        initial_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        multiplier: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Wait for a webset to complete processing.
         
+        The status is polled with exponential backoff: the first check comes
+        after initial_interval seconds and each later delay is multiplied by
+        multiplier, up to max_interval. Unset values come from the
+        EXA_CHECK_INTERVAL_* settings.
+        
         Args:
             webset_id: The ID of the webset to wait for
             timeout: Maximum time to wait in seconds (default: 1 hour)
-            check_interval: How often to check status in seconds
+            initial_interval: Seconds to wait before the second status check
+            max_interval: Upper bound for the delay between checks
+            multiplier: Factor the delay grows by after each check
             
         Returns:
             The completed webset information
         """
-        print(f"⏳ Waiting for webset {webset_id} to complete...")
-        print(f"   This may take a while depending on the search complexity.")
+        logger.info("Waiting for webset %s to complete...", webset_id)
+        
+        delay, max_interval, multiplier = _backoff_params(initial_interval, max_interval, multiplier)
+        deadline = time.monotonic() + timeout
         
         try:
-            # Exa provides a convenient wait_until_idle method
-            webset = self.exa.websets.wait_until_idle(
-                webset_id,
-                timeout=timeout
-            )
+            while True:
+                webset = self.exa.websets.get(webset_id)
+                if webset.status == "idle":
+                    break
+                
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Webset {webset_id} did not finish within {timeout} seconds"
+                    )
+                
+                time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+                delay = min(delay * multiplier, max_interval)
             
-            print(f"✅ Webset processing complete!")
-            print(f"   Status: {webset.status}")
+            logger.info("Webset %s processing complete (status: %s)", webset_id, webset.status)
             
             return webset
             
         except Exception as e:
-            print(f"❌ Error waiting for webset: {str(e)}")
+            logger.error("Error waiting for webset %s: %s", webset_id, e)
             raise
     
+    def iter_candidates(
+        self,
+        webset_id: str,
+        limit: Optional[int] = None,
+        include_content: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over candidate results from a webset.
+        
+        Items are fetched a page at a time by following the list cursor, so
+        the first candidates are available before the whole webset is read.
+        The next page is requested in the background while the current one
+        is being consumed, overlapping its round trip with processing.
+        
+        Enrichment results are returned on each item by the same list call,
+        since enrichments are requested when the webset is created; no
+        per-candidate requests are made.
+        
+        Args:
+            webset_id: The ID of the webset
+            limit: Maximum number of candidates to retrieve
+            include_content: Whether to include full content
+            
+        Yields:
+            Candidate items with their information
+        """
+        def fetch_page(cursor: Optional[str], page_limit: Optional[int]) -> Any:
+            params = {"webset_id": webset_id, "limit": page_limit}
+            if cursor:
+                params["cursor"] = cursor
+            return self.exa.websets.items.list(**params)
+        
+        remaining = limit
+        
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            page = fetch_page(None, remaining)
+            
+            while True:
+                if remaining is not None:
+                    remaining -= len(page.data)
+                
+                next_page = None
+                cursor = getattr(page, 'next_cursor', None)
+                if getattr(page, 'has_more', False) and cursor and (remaining is None or remaining > 0):
+                    next_page = prefetcher.submit(fetch_page, cursor, remaining)
+                
+                for item in page.data:
+                    item_id, url, status = _item_required_fields(item)
+                    candidate_data = {
+                        "id": item_id,
+                        "url": url,
+                        "title": getattr(item, 'title', None),
+                        "status": status,
+                        "verification": getattr(item, 'verification', None),
+                        "properties": getattr(item, 'properties', {}),
+                        "enrichments": getattr(item, 'enrichments', [])
+                    }
+                    
+                    if include_content and hasattr(item, 'content'):
+                        candidate_data['content'] = item.content
+                        
+                    yield candidate_data
+                
+                if next_page is None:
+                    return
+                page = next_page.result()
+    
     def get_candidates(
         self,
         webset_id: str,
@@ -216,6 +383,9 @@ class LinkedInCandidateFinder:
         """
         Retrieve candidate results from a webset.
         
+        Collects iter_candidates into a list; use iter_candidates directly
+        to process candidates as pages arrive.
+        
         Args:
             webset_id: The ID of the webset
             limit: Maximum number of candidates to retrieve
@@ -224,37 +394,17 @@ class LinkedInCandidateFinder:
         Returns:
             List of candidate items with their information
         """
-        print(f"📋 Fetching candidates from webset {webset_id}...")
+        logger.info("Fetching candidates from webset %s...", webset_id)
         
         try:
-            items = self.exa.websets.items.list(
-                webset_id=webset_id,
-                limit=limit
-            )
-            
-            candidates = []
-            for item in items.data:
-                candidate_data = {
-                    "id": item.id,
-                    "url": item.url,
-                    "title": getattr(item, 'title', None),
-                    "status": item.status,
-                    "verification": getattr(item, 'verification', None),
-                    "properties": getattr(item, 'properties', {}),
-                    "enrichments": getattr(item, 'enrichments', [])
-                }
-                
-                if include_content and hasattr(item, 'content'):
-                    candidate_data['content'] = item.content
-                    
-                candidates.append(candidate_data)
+            candidates = list(self.iter_candidates(webset_id, limit, include_content))
             
-            print(f"✅ Retrieved {len(candidates)} candidates")
+            logger.info("Retrieved %d candidates from webset %s", len(candidates), webset_id)
             
             return candidates
             
         except Exception as e:
-            print(f"❌ Error fetching candidates: {str(e)}")
+            logger.error("Error fetching candidates from webset %s: %s", webset_id, e)
             raise
     
     def search_and_wait(
@@ -290,6 +440,112 @@ class LinkedInCandidateFinder:
         # Get and return results
         return self.get_candidates(webset_info['id'])
     
+    async def _call_async(
+        self,
+        func: Callable[..., Any],
+        *args,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 3,
+        **kwargs
+    ) -> Any:
+        """
+        Run a blocking SDK call in a worker thread.
+        
+        With a rate_limiter, each attempt waits for a token first, and calls
+        rejected with HTTP 429 are retried up to max_retries times.
+        """
+        if rate_limiter is None:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return await call_with_rate_limit(
+            rate_limiter, func, *args, max_retries=max_retries, **kwargs
+        )
+    
+    async def wait_for_results_async(
+        self,
+        webset_id: str,
+        timeout: int = 3600,
+        initial_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        multiplier: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ) -> Any:
+        """
+        Async version of wait_for_results.
+        
+        Polls the webset status and sleeps on the event loop between checks,
+        so several searches can wait concurrently without blocking threads.
+        Uses the same exponential backoff as wait_for_results.
+        
+        Args:
+            webset_id: The ID of the webset to wait for
+            timeout: Maximum time to wait in seconds (default: 1 hour)
+            initial_interval: Seconds to wait before the second status check
+            max_interval: Upper bound for the delay between checks
+            multiplier: Factor the delay grows by after each check
+            rate_limiter: Optional shared limiter for the status requests
+            
+        Returns:
+            The completed webset information
+        """
+        logger.info("Waiting for webset %s to complete...", webset_id)
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay, max_interval, multiplier = _backoff_params(initial_interval, max_interval, multiplier)
+        
+        while True:
+            webset = await self._call_async(
+                self.exa.websets.get, webset_id, rate_limiter=rate_limiter
+            )
+            if webset.status == "idle":
+                logger.info("Webset %s processing complete", webset_id)
+                return webset
+            
+            if loop.time() >= deadline:
+                raise TimeoutError(
+                    f"Webset {webset_id} did not finish within {timeout} seconds"
+                )
+            
+            await asyncio.sleep(min(delay, max(deadline - loop.time(), 0)))
+            delay = min(delay * multiplier, max_interval)
+    
+    async def search_and_wait_async(
+        self,
+        search_criteria: SearchCriteria,
+        enrichments: Optional[List[EnrichmentConfig]] = None,
+        external_id: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of search_and_wait.
+        
+        Blocking SDK calls run in worker threads and polling waits yield the
+        event loop, so independent searches can be awaited together with
+        asyncio.gather.
+        
+        Args:
+            search_criteria: What candidates you're looking for
+            enrichments: Additional data to extract
+            external_id: Your own identifier
+            rate_limiter: Optional limiter shared with other concurrent searches
+            
+        Returns:
+            List of candidate results
+        """
+        webset_info = await self._call_async(
+            self.create_candidate_search,
+            search_criteria=search_criteria,
+            enrichments=enrichments,
+            external_id=external_id,
+            rate_limiter=rate_limiter
+        )
+        
+        await self.wait_for_results_async(webset_info['id'], rate_limiter=rate_limiter)
+        
+        return await self._call_async(
+            self.get_candidates, webset_info['id'], rate_limiter=rate_limiter
+        )
+    
     def get_webset_status(self, webset_id: str) -> Dict[str, Any]:
         """
         Check the status of a webset.
@@ -310,28 +566,28 @@ class LinkedInCandidateFinder:
             }
             
             # Get search progress if available
-            if hasattr(webset, 'searches') and webset.searches:
-                for search in webset.searches:
-                    search_info = {
-                        "id": search.id,
-                        "status": search.status,
-                        "query": search.query
+            for search in getattr(webset, 'searches', None) or ():
+                search_info = {
+                    "id": search.id,
+                    "status": search.status,
+                    "query": search.query
+                }
+                
+                progress = getattr(search, 'progress', None)
+                if progress is not None:
+                    search_info["progress"] = {
+                        "found": progress.found,
+                        "analyzed": progress.analyzed,
+                        "completion": progress.completion,
+                        "time_left": progress.timeLeft
                     }
-                    
-                    if hasattr(search, 'progress'):
-                        search_info["progress"] = {
-                            "found": search.progress.found,
-                            "analyzed": search.progress.analyzed,
-                            "completion": search.progress.completion,
-                            "time_left": search.progress.timeLeft
-                        }
-                    
-                    status_info["searches"].append(search_info)
+                
+                status_info["searches"].append(search_info)
             
             return status_info
             
         except Exception as e:
-            print(f"❌ Error getting webset status: {str(e)}")
+            logger.error("Error getting status of webset %s: %s", webset_id, e)
             raise
     
     def list_websets(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -360,12 +616,12 @@ class LinkedInCandidateFinder:
             return result
             
         except Exception as e:
-            print(f"❌ Error listing websets: {str(e)}")
+            logger.error("Error listing websets: %s", e)
             raise
 
 
 # Example usage and templates
-def example_ml_engineer_search():
+async def example_ml_engineer_search_async(rate_limiter: Optional[RateLimiter] = None):
     """Example: Finding ML Engineers at AI startups"""
     finder = LinkedInCandidateFinder()
     
@@ -400,16 +656,17 @@ def example_ml_engineer_search():
         )
     ]
     
-    results = finder.search_and_wait(
+    results = await finder.search_and_wait_async(
         search_criteria=criteria,
         enrichments=enrichments,
-        external_id="ml-engineers-2024"
+        external_id="ml-engineers-2024",
+        rate_limiter=rate_limiter
     )
     
     return results
 
 
-def example_sales_leader_search():
+async def example_sales_leader_search_async(rate_limiter: Optional[RateLimiter] = None):
     """Example: Finding Sales Leaders in SaaS"""
     finder = LinkedInCandidateFinder()
     
@@ -440,16 +697,17 @@ def example_sales_leader_search():
         )
     ]
     
-    results = finder.search_and_wait(
+    results = await finder.search_and_wait_async(
         search_criteria=criteria,
         enrichments=enrichments,
-        external_id="saas-sales-leaders"
+        external_id="saas-sales-leaders",
+        rate_limiter=rate_limiter
     )
     
     return results
 
 
-def example_phd_candidate_search():
+async def example_phd_candidate_search_async(rate_limiter: Optional[RateLimiter] = None):
     """Example: Finding PhD candidates for research positions"""
     finder = LinkedInCandidateFinder()
     
@@ -484,38 +742,66 @@ def example_phd_candidate_search():
         )
     ]
     
-    results = finder.search_and_wait(
+    results = await finder.search_and_wait_async(
         search_criteria=criteria,
         enrichments=enrichments,
-        external_id="nlp-phd-candidates"
+        external_id="nlp-phd-candidates",
+        rate_limiter=rate_limiter
     )
     
     return results
 
 
+def example_ml_engineer_search():
+    """Example: Finding ML Engineers at AI startups (blocking; see the _async variant)"""
+    return asyncio.run(example_ml_engineer_search_async())
+
+
+def example_sales_leader_search():
+    """Example: Finding Sales Leaders in SaaS (blocking; see the _async variant)"""
+    return asyncio.run(example_sales_leader_search_async())
+
+
+def example_phd_candidate_search():
+    """Example: Finding PhD candidates for research positions (blocking; see the _async variant)"""
+    return asyncio.run(example_phd_candidate_search_async())
+
+
+async def run_example_searches() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Run all example searches concurrently.
+    
+    The searches are independent, so their polling waits overlap and the
+    total wall-clock time is that of the slowest search rather than the sum.
+    """
+    rate_limiter = RateLimiter()
+    ml, sales, phd = await asyncio.gather(
+        example_ml_engineer_search_async(rate_limiter),
+        example_sales_leader_search_async(rate_limiter),
+        example_phd_candidate_search_async(rate_limiter)
+    )
+    return {'ml_engineers': ml, 'sales_leaders': sales, 'phd_candidates': phd}
+
+
 if __name__ == "__main__":
     import sys
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("""
 ╔═══════════════════════════════════════════════════════════╗
 ║  LinkedIn Candidate Finder - Powered by Exa Websets API  ║
 ╚═══════════════════════════════════════════════════════════╝
     """)
     
-    # Check for API key
-    if not os.getenv('EXA_API_KEY'):
-        print("❌ Error: EXA_API_KEY environment variable not set")
-        print("   Get your API key at: https://dashboard.exa.ai/api-keys")
-        print("   Then set it: export EXA_API_KEY='your-key-here'")
-        sys.exit(1)
-    
     print("\n📚 Available Examples:")
     print("1. Find ML Engineers at AI startups")
     print("2. Find Sales Leaders in SaaS")
     print("3. Find PhD Candidates in NLP")
     print("4. Custom search")
+    print("5. Run examples 1-3 concurrently")
     
-    choice = input("\nSelect an example (1-4): ").strip()
+    choice = input("\nSelect an example (1-5): ").strip()
     
     try:
         if choice == "1":
@@ -554,6 +840,15 @@ if __name__ == "__main__":
                     EnrichmentConfig("Extract current role and company")
                 ]
             )
+        elif choice == "5":
+            print("\n" + "="*60)
+            print("Running all examples concurrently")
+            print("="*60)
+            grouped = asyncio.run(run_example_searches())
+            for label, group in grouped.items():
+                print(f"   {label}: {len(group)} candidates")
+            results = [c for group in grouped.values() for c in group]
+            
         else:
             print("Invalid choice")
             sys.exit(1)
@@ -569,7 +864,8 @@ if __name__ == "__main__":
             print(f"   Status: {candidate.get('status')}")
             
             if candidate.get('properties'):
-                print(f"   Properties: {json.dumps(candidate['properties'], indent=6)}")
+                properties = orjson.dumps(candidate['properties'], option=orjson.OPT_INDENT_2)
+                print(f"   Properties: {properties.decode()}")
             
             if candidate.get('enrichments'):
                 print(f"   Enrichments: {len(candidate['enrichments'])} available")
@@ -578,8 +874,8 @@ if __name__ == "__main__":
         save = input("\n💾 Save results to file? (y/n): ").strip().lower()
         if save == 'y':
             filename = f"candidates_{int(time.time())}.json"
-            with open(filename, 'w') as f:
-                json.dump(results, f, indent=2)
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
             print(f"✅ Results saved to {filename}")
             
     except KeyboardInterrupt:
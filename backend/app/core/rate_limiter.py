@@ -0,0 +1,115 @@
+"""
+Adaptive rate limiting for Exa API calls
+"""
+from typing import Any, Callable, Optional
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Async token bucket whose request rate adapts to API pushback.
+    
+    Requests go out as fast as the current rate allows. A 429 response halves
+    the rate and pauses all callers for the server's Retry-After; every 10
+    consecutive successes raise the rate by 10% again, up to max_rate.
+    Create one limiter per event loop and share it between concurrent searches.
+    """
+    
+    def __init__(self, rate: float = 5.0, max_rate: float = 20.0, min_rate: float = 0.5):
+        """
+        Args:
+            rate: Initial requests per second
+            max_rate: Upper bound the rate can recover to
+            min_rate: Lower bound the rate can be reduced to
+        """
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.tokens = 1.0
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._successes = 0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                
+                # Allow bursts of up to one second's worth of requests
+                self.tokens = min(
+                    max(self.rate, 1.0),
+                    self.tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def record_success(self):
+        """Register a successful request, slowly increasing the rate"""
+        self._successes += 1
+        if self._successes >= 10:
+            self.rate = min(self.rate * 1.1, self.max_rate)
+            self._successes = 0
+    
+    def record_throttled(self, retry_after: Optional[float] = None):
+        """Register a 429 response, halving the rate and honouring Retry-After"""
+        self._successes = 0
+        self.rate = max(self.rate * 0.5, self.min_rate)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """
+    Check whether an SDK error is an HTTP 429 response.
+    
+    Returns None for other errors, otherwise the Retry-After delay in
+    seconds (0 if the server did not send one).
+    """
+    response = getattr(error, 'response', None)
+    status = getattr(error, 'status_code', None) or getattr(response, 'status_code', None)
+    if status != 429:
+        return None
+    
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        return float(headers.get('Retry-After', 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+async def call_with_rate_limit(
+    rate_limiter: RateLimiter,
+    func: Callable[..., Any],
+    *args,
+    max_retries: int = 3,
+    **kwargs
+) -> Any:
+    """
+    Run a blocking SDK call in a worker thread under a rate limiter.
+    
+    Each attempt waits for a token first, and calls rejected with HTTP 429
+    are retried up to max_retries times. Other errors are raised at once.
+    """
+    for attempt in range(max_retries + 1):
+        await rate_limiter.acquire()
+        try:
+            result = await asyncio.to_thread(func, *args, **kwargs)
+        except Exception as e:
+            retry_after = _retry_after(e)
+            if retry_after is None or attempt == max_retries:
+                raise
+            rate_limiter.record_throttled(retry_after)
+            continue
+        
+        rate_limiter.record_success()
+        return result
@@ -8,12 +8,28 @@ This module provides additional functionality for:
 - Result filtering and deduplication
 """
 
+import asyncio
 import csv
+import io
+import itertools
 import json
+import sys
 import time
-from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Mapping
 from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
 from app.core.finder import LinkedInCandidateFinder, SearchCriteria, EnrichmentConfig
+from app.core.rate_limiter import RateLimiter
+
+# Shared read-only default for missing nested dicts (avoids allocating one per lookup)
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
 
 class CandidateExporter:
@@ -33,30 +49,85 @@ class CandidateExporter:
             print("No candidates to export")
             return
         
-        # Default fields if not specified
         if fields is None:
-            fields = ['id', 'url', 'title', 'status']
-            # Add property fields
-            if candidates[0].get('properties'):
-                for key in candidates[0]['properties'].keys():
-                    fields.append(f'property_{key}')
+            fields = CandidateExporter._default_csv_fields(candidates[0])
         
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            
-            for candidate in candidates:
-                row = {}
-                for field in fields:
-                    if field.startswith('property_'):
-                        prop_name = field.replace('property_', '')
-                        row[field] = candidate.get('properties', {}).get(prop_name, '')
-                    else:
-                        row[field] = candidate.get(field, '')
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            writer.writerows(CandidateExporter._csv_rows(candidates, fields))
         
         print(f"✅ Exported {len(candidates)} candidates to {filename}")
     
+    @staticmethod
+    def iter_csv(
+        candidates: Iterable[Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+        chunk_size: int = 500
+    ) -> Iterator[str]:
+        """
+        Yield CSV text in chunks of up to chunk_size rows.
+        
+        Suitable for streaming an export (e.g. as an HTTP response body)
+        without building the whole file in memory. Without explicit fields,
+        the columns are taken from the first candidate; with explicit
+        fields, an empty input still yields the header row.
+        
+        Args:
+            candidates: Candidate dictionaries, consumed lazily
+            fields: List of fields to include (default: all)
+            chunk_size: Number of rows written per yielded chunk
+        """
+        candidates = iter(candidates)
+        first = next(candidates, None)
+        if fields is None:
+            if first is None:
+                return
+            fields = CandidateExporter._default_csv_fields(first)
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+        if first is None:
+            yield buffer.getvalue()
+            return
+        
+        rows = CandidateExporter._csv_rows(itertools.chain((first,), candidates), fields)
+        while True:
+            batch = list(itertools.islice(rows, chunk_size))
+            writer.writerows(batch)
+            chunk = buffer.getvalue()
+            if chunk:
+                yield chunk
+            if len(batch) < chunk_size:
+                return
+            buffer.seek(0)
+            buffer.truncate()
+    
+    @staticmethod
+    def _default_csv_fields(candidate: Dict[str, Any]) -> List[str]:
+        """Base fields plus a property_ column for each property of candidate"""
+        fields = ['id', 'url', 'title', 'status']
+        for key in (candidate.get('properties') or _EMPTY):
+            fields.append(f'property_{key}')
+        return fields
+    
+    @staticmethod
+    def _csv_rows(candidates: Iterable[Dict[str, Any]], fields: List[str]) -> Iterator[List[Any]]:
+        """Yield one row of values per candidate, in the order of fields"""
+        # Resolve each column to (is_property, key) once instead of per row
+        columns = [
+            (True, field[len('property_'):]) if field.startswith('property_') else (False, field)
+            for field in fields
+        ]
+        
+        for candidate in candidates:
+            properties = candidate.get('properties') or _EMPTY
+            yield [
+                properties.get(key, '') if is_property else candidate.get(key, '')
+                for is_property, key in columns
+            ]
+    
     @staticmethod
     def to_json(candidates: List[Dict[str, Any]], filename: str, pretty: bool = True):
         """
@@ -67,14 +138,46 @@ class CandidateExporter:
             filename: Output JSON filename
             pretty: Whether to format JSON with indentation
         """
-        with open(filename, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(candidates, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(candidates, f, ensure_ascii=False)
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(candidates, option=option))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(candidates, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(candidates, f, ensure_ascii=False)
         
         print(f"✅ Exported {len(candidates)} candidates to {filename}")
     
+    @staticmethod
+    def to_ndjson(candidates: Iterable[Dict[str, Any]], filename: str):
+        """
+        Export candidates to a newline-delimited JSON file.
+        
+        Each candidate is encoded and written on its own line, so memory use
+        stays at one record however many candidates are exported.
+        
+        Args:
+            candidates: Candidate dictionaries, consumed lazily
+            filename: Output NDJSON filename
+        """
+        count = 0
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                for candidate in candidates:
+                    f.write(orjson.dumps(candidate, option=orjson.OPT_APPEND_NEWLINE))
+                    count += 1
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                for candidate in candidates:
+                    f.write(json.dumps(candidate, ensure_ascii=False))
+                    f.write('\n')
+                    count += 1
+        
+        print(f"✅ Exported {count} candidates to {filename}")
+    
     @staticmethod
     def to_markdown(candidates: List[Dict[str, Any]], filename: str):
         """
@@ -85,27 +188,40 @@ class CandidateExporter:
             filename: Output Markdown filename
         """
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("# Candidate Search Results\n\n")
-            f.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-            f.write(f"**Total Candidates:** {len(candidates)}\n\n")
-            f.write("---\n\n")
-            
-            for i, candidate in enumerate(candidates, 1):
-                f.write(f"## {i}. {candidate.get('title', 'Candidate')}\n\n")
-                f.write(f"- **URL:** {candidate.get('url')}\n")
-                f.write(f"- **Status:** {candidate.get('status')}\n")
-                
-                if candidate.get('properties'):
-                    f.write(f"\n**Properties:**\n")
-                    for key, value in candidate['properties'].items():
-                        f.write(f"- {key}: {value}\n")
-                
-                if candidate.get('enrichments'):
-                    f.write(f"\n**Enrichments:** {len(candidate['enrichments'])} available\n")
-                
-                f.write("\n---\n\n")
+            f.write(
+                "# Candidate Search Results\n\n"
+                f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
+                f"**Total Candidates:** {len(candidates)}\n\n"
+                "---\n\n"
+            )
+            # Each candidate's section is assembled first and written with one call
+            f.writelines(
+                CandidateExporter._markdown_section(i, candidate)
+                for i, candidate in enumerate(candidates, 1)
+            )
         
         print(f"✅ Exported {len(candidates)} candidates to {filename}")
+    
+    @staticmethod
+    def _markdown_section(index: int, candidate: Dict[str, Any]) -> str:
+        """Render one candidate as a Markdown section"""
+        parts = [
+            f"## {index}. {candidate.get('title', 'Candidate')}\n\n",
+            f"- **URL:** {candidate.get('url')}\n",
+            f"- **Status:** {candidate.get('status')}\n",
+        ]
+        
+        properties = candidate.get('properties')
+        if properties:
+            parts.append("\n**Properties:**\n")
+            parts.extend(f"- {key}: {value}\n" for key, value in properties.items())
+        
+        enrichments = candidate.get('enrichments')
+        if enrichments:
+            parts.append(f"\n**Enrichments:** {len(enrichments)} available\n")
+        
+        parts.append("\n---\n\n")
+        return "".join(parts)
 
 
 class BatchSearchManager:
@@ -144,29 +260,12 @@ class BatchSearchManager:
         Execute all searches in the batch.
         
         Args:
-            parallel: If True, start all searches at once. If False, run sequentially.
+            parallel: If True, run all searches concurrently. If False, run sequentially.
         """
         print(f"\n🚀 Starting {len(self.searches)} searches...")
         
         if parallel:
-            # Start all searches
-            for search in self.searches:
-                print(f"\n📋 Starting: {search['name']}")
-                webset_info = self.finder.create_candidate_search(
-                    search_criteria=search['criteria'],
-                    enrichments=search['enrichments'],
-                    external_id=search['name']
-                )
-                search['webset_id'] = webset_info['id']
-                search['status'] = 'running'
-            
-            # Wait for all to complete
-            for search in self.searches:
-                print(f"\n⏳ Waiting for: {search['name']}")
-                self.finder.wait_for_results(search['webset_id'])
-                search['results'] = self.finder.get_candidates(search['webset_id'])
-                search['status'] = 'completed'
-                print(f"✅ {search['name']}: Found {len(search['results'])} candidates")
+            asyncio.run(self.run_all_async())
         else:
             # Run sequentially
             for search in self.searches:
@@ -179,6 +278,33 @@ class BatchSearchManager:
                 search['status'] = 'completed'
                 print(f"✅ {search['name']}: Found {len(search['results'])} candidates")
     
+    async def run_all_async(self):
+        """
+        Execute all searches concurrently on the running event loop.
+        
+        Total wall-clock time is bounded by the slowest search rather than
+        the sum of all searches. All searches share one adaptive rate limiter,
+        so the batch backs off together when Exa returns HTTP 429.
+        """
+        rate_limiter = RateLimiter()
+        # All searches start together, so announce them in one write
+        sys.stdout.write("".join(f"\n📋 Starting: {search['name']}\n" for search in self.searches))
+        await asyncio.gather(*(
+            self._run_search_async(search, rate_limiter) for search in self.searches
+        ))
+    
+    async def _run_search_async(self, search: Dict[str, Any], rate_limiter: RateLimiter):
+        """Run a single batch entry and record its results"""
+        search['status'] = 'running'
+        search['results'] = await self.finder.search_and_wait_async(
+            search_criteria=search['criteria'],
+            enrichments=search['enrichments'],
+            external_id=search['name'],
+            rate_limiter=rate_limiter
+        )
+        search['status'] = 'completed'
+        print(f"✅ {search['name']}: Found {len(search['results'])} candidates")
+    
     def get_all_results(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get results from all searches as a dictionary"""
         return {
@@ -192,21 +318,31 @@ class BatchSearchManager:
         Export all search results.
         
         Args:
-            format: 'json', 'csv', or 'markdown'
+            format: 'json', 'ndjson', 'csv', or 'markdown'
             output_dir: Directory to save files
         """
         exporter = CandidateExporter()
+        export = {
+            'json': exporter.to_json,
+            'ndjson': exporter.to_ndjson,
+            'csv': exporter.to_csv,
+            'markdown': exporter.to_markdown,
+        }.get(format)
+        if export is None:
+            return
+        
+        searches = [search for search in self.searches if search['results']]
+        if not searches:
+            return
         
-        for search in self.searches:
-            if search['results']:
-                filename = f"{output_dir}/{search['name']}.{format}"
-                
-                if format == 'json':
-                    exporter.to_json(search['results'], filename)
-                elif format == 'csv':
-                    exporter.to_csv(search['results'], filename)
-                elif format == 'markdown':
-                    exporter.to_markdown(search['results'], filename)
+        # Files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(searches))) as pool:
+            futures = [
+                pool.submit(export, search['results'], f"{output_dir}/{search['name']}.{format}")
+                for search in searches
+            ]
+            for future in as_completed(futures):
+                future.result()
 
 
 class ProgressMonitor:
@@ -226,15 +362,21 @@ class ProgressMonitor:
         """
         self.callbacks.append(callback)
     
-    def monitor(self, interval: int = 10, timeout: int = 3600):
+    def monitor(self, interval: int = 10, timeout: int = 3600, initial_interval: float = 1.0):
         """
         Monitor search progress and call callbacks.
         
+        Checks start after initial_interval seconds and back off by 1.5x per
+        check up to interval, so short searches are noticed quickly and long
+        ones are not polled at a fixed rate.
+        
         Args:
-            interval: Seconds between checks
+            interval: Maximum seconds between checks
             timeout: Maximum time to monitor
+            initial_interval: Seconds before the second check
         """
         start_time = time.time()
+        delay = min(initial_interval, interval)
         
         while True:
             elapsed = time.time() - start_time
@@ -256,7 +398,8 @@ class ProgressMonitor:
                 print("✅ Search completed!")
                 break
             
-            time.sleep(interval)
+            time.sleep(delay)
+            delay = min(delay * 1.5, interval)
 
 
 class CandidateFilter:
@@ -274,17 +417,65 @@ class CandidateFilter:
         Returns:
             List of unique candidates
         """
-        seen = set()
-        unique = []
+        unique = list(CandidateFilter._unique_by(candidates, key).values())
+        print(f"🔍 Deduplicated: {len(candidates)} → {len(unique)} candidates")
+        return unique
+    
+    @staticmethod
+    def _unique_by(candidates: Iterable[Dict[str, Any]], key: str) -> Dict[Any, Dict[str, Any]]:
+        """Map each non-empty key value to its first candidate, in first-seen order"""
+        # A dict keeps first-seen order, so it serves as both the seen-set and the result
+        by_key: Dict[Any, Dict[str, Any]] = {}
         
         for candidate in candidates:
             value = candidate.get(key)
-            if value and value not in seen:
-                seen.add(value)
-                unique.append(candidate)
+            if value and value not in by_key:
+                by_key[value] = candidate
         
-        print(f"🔍 Deduplicated: {len(candidates)} → {len(unique)} candidates")
-        return unique
+        return by_key
+    
+    @staticmethod
+    def apply(
+        candidates: List[Dict[str, Any]],
+        *,
+        dedupe_key: Optional[str] = None,
+        status: Optional[str] = None,
+        verification_passed: Optional[bool] = None,
+        properties: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply several filters in a single pass.
+        
+        Gives the same result as chaining deduplicate, filter_by_status,
+        filter_by_verification and filter_by_property in that order, but
+        reuses _unique_by and the lazy ifilter_* variants so no intermediate
+        list is built for each step. Filters left as None are skipped.
+        
+        Args:
+            candidates: List of candidates
+            dedupe_key: Field to use for deduplication
+            status: Status to filter by
+            verification_passed: Verification outcome to filter by
+            properties: Property values that must all match
+        
+        Returns:
+            Filtered list
+        """
+        filtered: Iterable[Dict[str, Any]] = candidates
+        if dedupe_key is not None:
+            # Duplicates are dropped before any other filter, keeping the same
+            # candidate deduplicate() would
+            filtered = CandidateFilter._unique_by(candidates, dedupe_key).values()
+        if status is not None:
+            filtered = CandidateFilter.ifilter_by_status(filtered, status)
+        if verification_passed is not None:
+            filtered = CandidateFilter.ifilter_by_verification(filtered, verification_passed)
+        for name, value in (properties or _EMPTY).items():
+            filtered = CandidateFilter.ifilter_by_property(filtered, name, value)
+        filtered = list(filtered)
+        
+        print(f"🔍 Filtered: {len(candidates)} → {len(filtered)} candidates")
+        return filtered
     
     @staticmethod
     def filter_by_status(
@@ -301,7 +492,7 @@ class CandidateFilter:
         Returns:
             Filtered list
         """
-        filtered = [c for c in candidates if c.get('status') == status]
+        filtered = list(CandidateFilter.ifilter_by_status(candidates, status))
         print(f"🔍 Filtered by status '{status}': {len(filtered)} candidates")
         return filtered
     
@@ -320,10 +511,7 @@ class CandidateFilter:
         Returns:
             Filtered list
         """
-        filtered = [
-            c for c in candidates
-            if c.get('verification', {}).get('passed') == passed
-        ]
+        filtered = list(CandidateFilter.ifilter_by_verification(candidates, passed))
         print(f"🔍 Filtered by verification: {len(filtered)} candidates")
         return filtered
     
@@ -344,12 +532,39 @@ class CandidateFilter:
         Returns:
             Filtered list
         """
-        filtered = [
-            c for c in candidates
-            if c.get('properties', {}).get(property_name) == property_value
-        ]
+        filtered = list(CandidateFilter.ifilter_by_property(candidates, property_name, property_value))
         print(f"🔍 Filtered by {property_name}={property_value}: {len(filtered)} candidates")
         return filtered
+    
+    # Lazy variants: these yield matching candidates without printing or
+    # building a list, so several filters can be chained in one pass
+    @staticmethod
+    def ifilter_by_status(
+        candidates: Iterable[Dict[str, Any]],
+        status: str = 'completed'
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield candidates with the given status"""
+        return (c for c in candidates if c.get('status') == status)
+    
+    @staticmethod
+    def ifilter_by_verification(
+        candidates: Iterable[Dict[str, Any]],
+        passed: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield candidates whose verification outcome equals passed"""
+        return (c for c in candidates if (c.get('verification') or _EMPTY).get('passed') == passed)
+    
+    @staticmethod
+    def ifilter_by_property(
+        candidates: Iterable[Dict[str, Any]],
+        property_name: str,
+        property_value: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield candidates whose property_name equals property_value"""
+        return (
+            c for c in candidates
+            if (c.get('properties') or _EMPTY).get(property_name) == property_value
+        )
 
 
 # Example usage functions
@@ -462,9 +677,12 @@ def example_filtering_and_export():
     )
     
     # Apply filters
-    candidates = CandidateFilter.deduplicate(candidates)
-    candidates = CandidateFilter.filter_by_status(candidates, 'completed')
-    candidates = CandidateFilter.filter_by_verification(candidates, passed=True)
+    candidates = CandidateFilter.apply(
+        candidates,
+        dedupe_key='url',
+        status='completed',
+        verification_passed=True
+    )
     
     # Export to multiple formats
     exporter = CandidateExporter()
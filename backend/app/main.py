@@ -1,13 +1,30 @@
 """
 Main FastAPI application for Juicebox AI
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
+import logging
+import logging.handlers
+import queue
+import time
 
-from app.core.config import settings
+from app.core.config import Settings, get_settings
 from app.models.schemas import HealthCheckResponse
 from app.api.routes import search, candidates
+from app.services.search_service import search_service
+
+settings = get_settings()
+
+# Log records are handed to a queue on the event loop and written to stderr
+# by a background thread, so a slow terminal never blocks request handling
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(), respect_handler_level=True
+)
+logging.getLogger("app").addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger("app").setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
 
 # Create FastAPI app
 app = FastAPI(
@@ -16,12 +33,14 @@ app = FastAPI(
     version=settings.VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    # CORSMiddleware checks each request's Origin with `in`; a set makes that O(1)
+    allow_origins=frozenset(settings.BACKEND_CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -32,29 +51,40 @@ app.include_router(search.router, prefix=settings.API_V1_STR)
 app.include_router(candidates.router, prefix=settings.API_V1_STR)
 
 
+# Encoded health response, rebuilt at most once per second so frequent
+# load balancer pings are answered with cached bytes
+_health_cache = {"expires_at": 0.0, "body": b""}
+
+
+def _health_response(settings: Settings) -> Response:
+    """Return the cached health check body, refreshing it when stale"""
+    now = time.monotonic()
+    if now >= _health_cache["expires_at"]:
+        _health_cache["body"] = HealthCheckResponse(
+            status="healthy",
+            version=settings.VERSION,
+            timestamp=datetime.now()
+        ).model_dump_json().encode()
+        _health_cache["expires_at"] = now + 1.0
+    return Response(content=_health_cache["body"], media_type="application/json")
+
+
 @app.get("/", response_model=HealthCheckResponse)
-async def root():
+async def root(settings: Settings = Depends(get_settings)):
     """Root endpoint - health check"""
-    return HealthCheckResponse(
-        status="healthy",
-        version=settings.VERSION,
-        timestamp=datetime.now()
-    )
+    return _health_response(settings)
 
 
 @app.get("/health", response_model=HealthCheckResponse)
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """Health check endpoint"""
-    return HealthCheckResponse(
-        status="healthy",
-        version=settings.VERSION,
-        timestamp=datetime.now()
-    )
+    return _health_response(settings)
 
 
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup"""
+    _log_listener.start()
     print(f"""
     ╔═══════════════════════════════════════════════════════════╗
     ║                                                           ║
@@ -71,6 +101,8 @@ async def startup_event():
 async def shutdown_event():
     """Run on application shutdown"""
     print("\n👋 Shutting down Juicebox AI Backend...")
+    search_service.shutdown()
+    _log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 """
 Pydantic models for request/response validation
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 from datetime import datetime
@@ -33,23 +33,22 @@ class SearchRequest(BaseModel):
     exclude_criteria: List[str] = Field(default_factory=list, description="Exclusion criteria")
     enrichments: List[str] = Field(default_factory=list, description="Data enrichment requests")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "query": "Senior ML Engineers at AI startups in San Francisco",
-                "count": 10,
-                "entity": "person",
-                "criteria": [
-                    "Has 5+ years of machine learning experience",
-                    "Currently employed at a tech startup",
-                    "Based in San Francisco Bay Area"
-                ],
-                "enrichments": [
-                    "Find their LinkedIn profile",
-                    "Extract current role and company"
-                ]
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "query": "Senior ML Engineers at AI startups in San Francisco",
+            "count": 10,
+            "entity": "person",
+            "criteria": [
+                "Has 5+ years of machine learning experience",
+                "Currently employed at a tech startup",
+                "Based in San Francisco Bay Area"
+            ],
+            "enrichments": [
+                "Find their LinkedIn profile",
+                "Extract current role and company"
+            ]
         }
+    })
 
 
 class EnrichmentRequest(BaseModel):
@@ -62,6 +61,8 @@ class EnrichmentRequest(BaseModel):
 # Response Models
 class CriteriaResult(BaseModel):
     """Verification criteria result"""
+    model_config = ConfigDict(frozen=True)
+
     description: str
     passed: bool
     reasoning: str
@@ -70,12 +71,16 @@ class CriteriaResult(BaseModel):
 
 class VerificationResult(BaseModel):
     """Verification result for a candidate"""
+    model_config = ConfigDict(frozen=True)
+
     passed: bool
     criteria_results: List[CriteriaResult] = []
 
 
 class EnrichmentResult(BaseModel):
     """Enrichment result"""
+    model_config = ConfigDict(frozen=True)
+
     description: str
     status: str
     result: Optional[Any] = None
@@ -83,6 +88,8 @@ class EnrichmentResult(BaseModel):
 
 class CandidateProperties(BaseModel):
     """Candidate properties"""
+    model_config = ConfigDict(frozen=True)
+
     name: Optional[str] = None
     current_role: Optional[str] = None
     current_company: Optional[str] = None
@@ -95,6 +102,8 @@ class CandidateProperties(BaseModel):
 
 class Candidate(BaseModel):
     """Individual candidate result"""
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
     id: str
     url: str
     title: str
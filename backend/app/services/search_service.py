@@ -1,9 +1,16 @@
 """
 Search service for managing candidate searches
 """
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 import asyncio
+import heapq
+import logging
+import operator
+import random
 import uuid
 
 from app.core.finder import (
@@ -24,25 +31,120 @@ from app.models.schemas import (
     EnrichmentResult,
     EntityTypeEnum
 )
-from app.core.config import settings
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_criterion_passed = operator.attrgetter("passed")
+
+
+def _as_str(value: Any) -> str:
+    """Convert a raw SDK value to str; None becomes "" and enum members give their value"""
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        value = value.value
+    return value if isinstance(value, str) else str(value)
+
+
+def _score_key(candidate: Candidate) -> float:
+    """Sort key ranking unscored candidates (score None) with a score of 0"""
+    return candidate.score or 0
+
+
+# Candidate filters specialized per filter shape, so the per-candidate loop
+# only evaluates the predicates that were actually requested
+def _filter_by_score(candidates: List[Candidate], min_score: Optional[float]) -> List[Candidate]:
+    return [c for c in candidates if c.score and c.score >= min_score]
+
+
+def _filter_verified(candidates: List[Candidate], min_score: Optional[float]) -> List[Candidate]:
+    return [c for c in candidates if c.verification and c.verification.passed]
+
+
+def _filter_by_score_verified(candidates: List[Candidate], min_score: Optional[float]) -> List[Candidate]:
+    return [
+        c for c in candidates
+        if c.score and c.score >= min_score and c.verification and c.verification.passed
+    ]
+
+
+# Keyed by (min_score is set, verified_only)
+_CANDIDATE_FILTERS = {
+    (True, False): _filter_by_score,
+    (False, True): _filter_verified,
+    (True, True): _filter_by_score_verified,
+}
+
+# API entity types mapped to the finder's entity types
+_ENTITY_TYPES = {
+    EntityTypeEnum.PERSON: EntityType.PERSON,
+    EntityTypeEnum.COMPANY: EntityType.COMPANY,
+    EntityTypeEnum.RESEARCH_PAPER: EntityType.RESEARCH_PAPER,
+    EntityTypeEnum.ARTICLE: EntityType.ARTICLE,
+}
+
+
+@lru_cache(maxsize=256)
+def _make_enrichments(descriptions: Tuple[str, ...]) -> Tuple[EnrichmentConfig, ...]:
+    """Build (and memoize) the frozen enrichment configs for a list of descriptions"""
+    return tuple(EnrichmentConfig(description=desc) for desc in descriptions)
 
 
 class SearchService:
     """Service for managing candidate searches"""
 
     def __init__(self):
-        self.finder = LinkedInCandidateFinder(api_key=settings.EXA_API_KEY)
+        self._finder: Optional[LinkedInCandidateFinder] = None
+        self._exa_pool: Optional[ThreadPoolExecutor] = None
+        self._search_slots: Optional[asyncio.Semaphore] = None
+        # Futures of websets waiting for completion, resolved by the shared poller
+        self._pending_websets: Dict[str, asyncio.Future] = {}
+        self._poller: Optional[asyncio.Task] = None
+        self._poll_wakeup: Optional[asyncio.Event] = None
         self.active_searches: Dict[str, Dict] = {}
+        self._by_id: Dict[str, Candidate] = {}
+        # Candidates from all searches, kept sorted by score (highest first)
+        self._all_candidates: List[Candidate] = []
+        # Incremented on every change to stored searches, used for cache keys/ETags
+        self.data_version = 0
+        self._list_cached: Optional[Tuple[int, List[SearchStatusResponse]]] = None
+        # Status responses per search, dropped whenever that search changes
+        self._status_cache: Dict[str, SearchStatusResponse] = {}
+
+    @property
+    def finder(self) -> LinkedInCandidateFinder:
+        """Candidate finder, created on first use so importing the service doesn't load settings"""
+        if self._finder is None:
+            self._finder = LinkedInCandidateFinder(api_key=get_settings().EXA_API_KEY)
+        return self._finder
+
+    def _mark_changed(self, search_id: str):
+        """Record that a search's state changed, invalidating derived caches"""
+        self.data_version += 1
+        self._status_cache.pop(search_id, None)
+
+    async def _call_exa(self, func: Callable[..., T], *args) -> T:
+        """Run a blocking finder call on the bounded Exa thread pool"""
+        if self._exa_pool is None:
+            self._exa_pool = ThreadPoolExecutor(
+                max_workers=get_settings().EXA_MAX_CONCURRENCY,
+                thread_name_prefix="exa"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._exa_pool, func, *args)
+
+    def shutdown(self):
+        """Release the Exa thread pool"""
+        if self._exa_pool is not None:
+            self._exa_pool.shutdown(wait=False)
+            self._exa_pool = None
 
     def _convert_entity_type(self, entity: EntityTypeEnum) -> EntityType:
         """Convert API entity type to finder entity type"""
-        mapping = {
-            EntityTypeEnum.PERSON: EntityType.PERSON,
-            EntityTypeEnum.COMPANY: EntityType.COMPANY,
-            EntityTypeEnum.RESEARCH_PAPER: EntityType.RESEARCH_PAPER,
-            EntityTypeEnum.ARTICLE: EntityType.ARTICLE,
-        }
-        return mapping[entity]
+        return _ENTITY_TYPES[entity]
 
     async def create_search(self, request: SearchRequest) -> SearchResponse:
         """Create a new candidate search"""
@@ -60,20 +162,20 @@ class SearchService:
         )
 
         # Convert enrichments
-        enrichments = [
-            EnrichmentConfig(description=desc)
-            for desc in request.enrichments
-        ]
+        enrichments = list(_make_enrichments(tuple(request.enrichments)))
 
         # Store search metadata
+        now = datetime.now()
         self.active_searches[search_id] = {
             "status": SearchStatus.PENDING,
             "query": request.query,
             "count": request.count,
-            "created_at": datetime.now(),
+            "created_at": now,
             "webset_id": None,
-            "candidates": []
+            "candidates": [],
+            "progress_percent": 0.0
         }
+        self._mark_changed(search_id)
 
         # Start search in background
         asyncio.create_task(self._run_search(search_id, criteria, enrichments))
@@ -83,7 +185,7 @@ class SearchService:
             status=SearchStatus.PENDING,
             query=request.query,
             count=request.count,
-            created_at=datetime.now()
+            created_at=now
         )
 
     async def _run_search(
@@ -93,162 +195,289 @@ class SearchService:
         enrichments: List[EnrichmentConfig]
     ):
         """Run search in background"""
+        # Searches beyond EXA_MAX_CONCURRENCY wait here, still PENDING
+        if self._search_slots is None:
+            self._search_slots = asyncio.Semaphore(get_settings().EXA_MAX_CONCURRENCY)
+        async with self._search_slots:
+            await self._execute_search(search_id, criteria, enrichments)
+
+    async def _execute_search(
+        self,
+        search_id: str,
+        criteria: SearchCriteria,
+        enrichments: List[EnrichmentConfig]
+    ):
+        """Create the webset, wait for it and store the converted candidates"""
         try:
             # Update status
             self.active_searches[search_id]["status"] = SearchStatus.IN_PROGRESS
+            self._mark_changed(search_id)
 
             # Create webset
-            webset_id = await asyncio.to_thread(
+            webset_info = await self._call_exa(
                 self.finder.create_candidate_search,
                 criteria,
                 enrichments
             )
+            webset_id = webset_info["id"]
 
             self.active_searches[search_id]["webset_id"] = webset_id
 
-            # Wait for results
-            results = await asyncio.to_thread(
-                self.finder.wait_for_results,
-                webset_id,
-                check_interval=settings.EXA_CHECK_INTERVAL
-            )
-
-            # Convert results to candidates
-            candidates = self._convert_results_to_candidates(results)
+            # Wait for the webset to finish, then fetch and convert its items
+            # page by page, so the raw results are never held all at once
+            await self._wait_for_webset(webset_id)
+            candidates = await self._call_exa(self._fetch_candidates, webset_id)
 
             # Update search with results
-            self.active_searches[search_id]["status"] = SearchStatus.COMPLETED
-            self.active_searches[search_id]["candidates"] = candidates
+            search_data = self.active_searches[search_id]
+            search_data["status"] = SearchStatus.COMPLETED
+            search_data["candidates"] = candidates
+            # Progress only changes here, so it is stored rather than
+            # recomputed on every status request
+            if search_data["count"] > 0:
+                search_data["progress_percent"] = min(len(candidates) / search_data["count"] * 100, 100)
+            self._by_id.update((c.id, c) for c in candidates)
+            self._all_candidates = list(heapq.merge(
+                self._all_candidates,
+                candidates,
+                key=_score_key,
+                reverse=True
+            ))
+            self._mark_changed(search_id)
 
         except Exception as e:
-            print(f"Search {search_id} failed: {str(e)}")
+            logger.error("Search %s failed: %s", search_id, e)
             self.active_searches[search_id]["status"] = SearchStatus.FAILED
             self.active_searches[search_id]["error"] = str(e)
+            self._mark_changed(search_id)
+
+    async def _wait_for_webset(self, webset_id: str):
+        """
+        Wait until a webset is idle.
+
+        The webset is registered with a single shared poller instead of
+        polling on its own, so concurrent searches are checked together.
+        """
+        timeout = get_settings().EXA_TIMEOUT
+        future = asyncio.get_running_loop().create_future()
+        self._pending_websets[webset_id] = future
 
-    def _convert_results_to_candidates(self, results: List[Dict]) -> List[Candidate]:
-        """Convert raw results to Candidate models"""
-        candidates = []
+        if self._poll_wakeup is None:
+            self._poll_wakeup = asyncio.Event()
+        self._poll_wakeup.set()
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll_websets())
 
-        for item in results:
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Webset {webset_id} did not finish within {timeout} seconds"
+            ) from None
+        finally:
+            self._pending_websets.pop(webset_id, None)
+
+    async def _poll_websets(self):
+        """
+        Check the status of every pending webset until none are left.
+
+        Each round fetches all statuses concurrently and sleeps on the event
+        loop, so waiting never occupies an Exa pool thread. The delay between
+        rounds backs off within the EXA_CHECK_INTERVAL_* settings, with
+        random jitter, and resets whenever a new webset is registered.
+        """
+        settings = get_settings()
+        base = settings.EXA_CHECK_INTERVAL_INITIAL
+        delay = base
+        # Consecutive failed status checks per webset
+        errors: Dict[str, int] = {}
+
+        while self._pending_websets:
             try:
-                # Extract verification results with safe dictionary access
-                verification = None
-                verification_data = item.get("verification")
-                if verification_data:
-                    criteria_results = [
-                        CriteriaResult(
-                            description=cr.get("description", ""),
-                            passed=cr.get("passed", False),
-                            reasoning=cr.get("reasoning", ""),
-                            references=cr.get("references", [])
-                        )
-                        for cr in verification_data.get("criteria_results", [])
-                    ]
-                    verification = VerificationResult(
-                        passed=verification_data.get("passed", False),
-                        criteria_results=criteria_results
-                    )
-            except Exception as e:
-                print(f"Warning: Failed to extract verification for candidate: {str(e)}")
-                verification = None
-
-            # Extract properties
-            props = item.get("properties", {})
-            properties = CandidateProperties(
-                name=props.get("name"),
-                current_role=props.get("current_role"),
-                current_company=props.get("current_company"),
-                location=props.get("location"),
-                linkedin_url=props.get("linkedin_url"),
-                email=props.get("email"),
-                experience_years=props.get("experience_years"),
-                skills=props.get("skills", [])
-            )
+                await asyncio.wait_for(self._poll_wakeup.wait(), delay + random.uniform(0, base))
+                self._poll_wakeup.clear()
+                delay = base
+            except asyncio.TimeoutError:
+                delay = min(delay * settings.EXA_CHECK_INTERVAL_MULTIPLIER, settings.EXA_CHECK_INTERVAL_MAX)
+
+            # A failing round must not end the task, or every waiter would
+            # hang until EXA_TIMEOUT
+            try:
+                pending = list(self._pending_websets.items())
+                statuses = await asyncio.gather(
+                    *(self._call_exa(self.finder.get_webset_status, webset_id) for webset_id, _ in pending),
+                    return_exceptions=True
+                )
+                for (webset_id, future), webset_status in zip(pending, statuses):
+                    if future.done():
+                        errors.pop(webset_id, None)
+                        continue
+                    if isinstance(webset_status, Exception):
+                        # Transient errors are retried on later rounds until
+                        # EXA_MAX_RETRIES consecutive checks have failed
+                        failures = errors.get(webset_id, 0) + 1
+                        if failures > settings.EXA_MAX_RETRIES:
+                            errors.pop(webset_id, None)
+                            future.set_exception(webset_status)
+                        else:
+                            errors[webset_id] = failures
+                            logger.warning(
+                                "Status check %d for webset %s failed: %s",
+                                failures, webset_id, webset_status
+                            )
+                        continue
+                    errors.pop(webset_id, None)
+                    if webset_status.get("status") == "idle":
+                        future.set_result(None)
+            except Exception:
+                logger.exception("Webset status poll failed")
+
+    def _fetch_candidates(self, webset_id: str) -> List[Candidate]:
+        """Stream a webset's items into sorted Candidate models (blocking)"""
+        return self._convert_results_to_candidates(self.finder.iter_candidates(webset_id))
+
+    def _convert_results_to_candidates(self, results: Iterable[Dict]) -> List[Candidate]:
+        """Convert raw results to Candidate models, sorted by score (highest first)"""
+        # Candidates converted in one batch share a creation timestamp
+        now = datetime.now()
+
+        # Results are consumed lazily, so each raw item can be released as
+        # soon as its candidate is built
+        return sorted(
+            (self._build_candidate(item, now) for item in results),
+            key=_score_key,
+            reverse=True
+        )
 
-            # Extract enrichments
-            enrichments = [
-                EnrichmentResult(
-                    description=enr.get("description", ""),
-                    status=enr.get("status", "unknown"),
-                    result=enr.get("result")
+    def _build_candidate(self, item: Dict, now: datetime) -> Candidate:
+        """Convert one raw result to a Candidate model"""
+        try:
+            # Extract verification results with safe dictionary access
+            verification = None
+            verification_data = item.get("verification")
+            if verification_data:
+                criteria_results = [
+                    CriteriaResult(
+                        description=cr.get("description", ""),
+                        passed=cr.get("passed", False),
+                        reasoning=cr.get("reasoning", ""),
+                        references=cr.get("references", [])
+                    )
+                    for cr in verification_data.get("criteria_results", [])
+                ]
+                verification = VerificationResult(
+                    passed=verification_data.get("passed", False),
+                    criteria_results=criteria_results
                 )
-                for enr in item.get("enrichments", [])
-            ]
-
-            # Calculate AI score (based on verification)
-            score = None
-            if verification and verification.criteria_results:
-                passed_count = sum(1 for cr in verification.criteria_results if cr.passed)
-                total_count = len(verification.criteria_results)
-                score = (passed_count / total_count) * 100 if total_count > 0 else 0
-
-            candidate = Candidate(
-                id=item.get("id", str(uuid.uuid4())),
-                url=item.get("url", ""),
-                title=item.get("title", ""),
-                status=item.get("status", "unknown"),
-                verification=verification,
-                properties=properties,
-                enrichments=enrichments,
-                score=score,
-                created_at=datetime.now()
-            )
+        except Exception as e:
+            logger.warning("Failed to extract verification for candidate: %s", e)
+            verification = None
 
-            candidates.append(candidate)
+        # Extract properties; the model supplies defaults for missing
+        # fields and ignores keys it doesn't define
+        properties = CandidateProperties.model_validate(item.get("properties") or {})
 
-        # Sort by score (highest first)
-        candidates.sort(key=lambda x: x.score or 0, reverse=True)
+        # Extract enrichments
+        enrichments = [
+            EnrichmentResult(
+                description=enr.get("description", ""),
+                status=enr.get("status", "unknown"),
+                result=enr.get("result")
+            )
+            for enr in item.get("enrichments", [])
+        ]
 
-        return candidates
+        # Calculate AI score (based on verification)
+        score = None
+        if verification and verification.criteria_results:
+            criteria_results = verification.criteria_results
+            # True counts as 1, so this sums the passed flags in a single C-level pass
+            passed_count = sum(map(_criterion_passed, criteria_results))
+            score = passed_count / len(criteria_results) * 100
+
+        # The nested models were validated above and the remaining fields are
+        # converted to str here, so the top-level model skips validation
+        return Candidate.model_construct(
+            id=_as_str(item.get("id")) or str(uuid.uuid4()),
+            url=_as_str(item.get("url")),
+            title=_as_str(item.get("title")),
+            status=_as_str(item.get("status")) or "unknown",
+            verification=verification,
+            properties=properties,
+            enrichments=enrichments,
+            score=score,
+            created_at=now
+        )
 
     async def get_search_status(self, search_id: str) -> Optional[SearchStatusResponse]:
         """Get status of a search"""
         if search_id not in self.active_searches:
             return None
 
-        search_data = self.active_searches[search_id]
+        cached = self._status_cache.get(search_id)
+        if cached is not None:
+            return cached
 
-        # Calculate progress
-        total_found = len(search_data["candidates"])
-        total_requested = search_data["count"]
-        progress_percent = (total_found / total_requested * 100) if total_requested > 0 else 0
+        search_data = self.active_searches[search_id]
 
-        return SearchStatusResponse(
+        status = SearchStatusResponse(
             search_id=search_id,
             status=search_data["status"],
             query=search_data["query"],
-            total_requested=total_requested,
-            total_found=total_found,
+            total_requested=search_data["count"],
+            total_found=len(search_data["candidates"]),
             candidates=search_data["candidates"],
-            progress_percent=min(progress_percent, 100)
+            progress_percent=search_data["progress_percent"]
         )
+        self._status_cache[search_id] = status
+        return status
 
     async def list_all_searches(self) -> List[SearchStatusResponse]:
         """List all searches"""
-        searches = []
-        for search_id in self.active_searches:
-            status = await self.get_search_status(search_id)
-            if status:
-                searches.append(status)
+        # Reuse the previous result until any search changes
+        if self._list_cached and self._list_cached[0] == self.data_version:
+            return self._list_cached[1]
+
+        # Only searches that changed since the last call are rebuilt; the
+        # rest come from the per-search status cache
+        version = self.data_version
+        searches = [
+            await self.get_search_status(search_id)
+            for search_id in self.active_searches
+        ]
+
+        self._list_cached = (version, searches)
         return searches
 
-    async def get_candidates(self, search_id: Optional[str] = None) -> List[Candidate]:
-        """Get all candidates or candidates from specific search"""
+    async def get_candidates(
+        self,
+        search_id: Optional[str] = None,
+        min_score: Optional[float] = None,
+        verified_only: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Candidate]:
+        """
+        Get all candidates or candidates from specific search, optionally filtered.
+
+        With limit, only the top `limit` candidates by score are returned.
+        """
+        # Both per-search and merged lists are stored pre-sorted by score,
+        # so the top candidates are always a prefix and never need a sort
         if search_id:
             search_data = self.active_searches.get(search_id)
-            if search_data:
-                return search_data.get("candidates", [])
-            return []
+            source = search_data.get("candidates", []) if search_data else []
+        else:
+            source = self._all_candidates
 
-        # Return all candidates from all searches
-        all_candidates = []
-        for search_data in self.active_searches.values():
-            all_candidates.extend(search_data.get("candidates", []))
+        candidate_filter = _CANDIDATE_FILTERS.get((min_score is not None, bool(verified_only)))
+        if candidate_filter is None:
+            return source[:limit]
 
-        # Sort by score
-        all_candidates.sort(key=lambda x: x.score or 0, reverse=True)
+        return candidate_filter(source, min_score)[:limit]
 
-        return all_candidates
+    async def get_candidate_by_id(self, candidate_id: str) -> Optional[Candidate]:
+        """Get a single candidate by ID"""
+        return self._by_id.get(candidate_id)
 
 
 # Global search service instance
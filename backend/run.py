@@ -2,9 +2,10 @@
 Run script for Juicebox AI Backend
 """
 import uvicorn
-from app.core.config import settings
+from app.core.config import get_settings
 
 if __name__ == "__main__":
+    settings = get_settings()
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
@@ -1,16 +1,18 @@
 """
 Quick test script for the Juicebox AI Backend API
 """
-import requests
-import time
-import json
+import asyncio
 
+import httpx
 
-def test_health_check():
+BASE_URL = "http://localhost:8000"
+
+
+async def check_health(client: httpx.AsyncClient):
     """Test health check endpoint"""
     print("\n🔍 Testing Health Check...")
     try:
-        response = requests.get("http://localhost:8000/health")
+        response = await client.get("/health")
         if response.status_code == 200:
             print("✅ Health check passed!")
             print(f"   Response: {response.json()}")
@@ -24,7 +26,7 @@ def test_health_check():
         return False
 
 
-def test_create_search():
+async def check_create_search(client: httpx.AsyncClient):
     """Test creating a search"""
     print("\n🔍 Testing Create Search...")
 
@@ -43,8 +45,8 @@ def test_create_search():
     }
 
     try:
-        response = requests.post(
-            "http://localhost:8000/api/v1/search",
+        response = await client.post(
+            "/api/v1/search",
             json=search_request
         )
 
@@ -64,12 +66,12 @@ def test_create_search():
         return None
 
 
-def test_get_search_status(search_id):
+async def check_get_search_status(client: httpx.AsyncClient, search_id):
     """Test getting search status"""
     print(f"\n🔍 Testing Get Search Status (ID: {search_id})...")
 
     try:
-        response = requests.get(f"http://localhost:8000/api/v1/search/{search_id}")
+        response = await client.get(f"/api/v1/search/{search_id}")
 
         if response.status_code == 200:
             data = response.json()
@@ -87,12 +89,12 @@ def test_get_search_status(search_id):
         return None
 
 
-def test_list_searches():
+async def check_list_searches(client: httpx.AsyncClient):
     """Test listing all searches"""
     print("\n🔍 Testing List All Searches...")
 
     try:
-        response = requests.get("http://localhost:8000/api/v1/search")
+        response = await client.get("/api/v1/search")
 
         if response.status_code == 200:
             searches = response.json()
@@ -109,12 +111,12 @@ def test_list_searches():
         return None
 
 
-def test_get_candidates():
+async def check_get_candidates(client: httpx.AsyncClient):
     """Test getting candidates"""
     print("\n🔍 Testing Get All Candidates...")
 
     try:
-        response = requests.get("http://localhost:8000/api/v1/candidates")
+        response = await client.get("/api/v1/candidates")
 
         if response.status_code == 200:
             data = response.json()
@@ -133,21 +135,34 @@ def test_get_candidates():
         return None
 
 
-def main():
+async def main():
     """Run all tests"""
     print("=" * 60)
     print("🧪 Juicebox AI Backend API Tests")
     print("=" * 60)
 
-    # Test 1: Health check
-    if not test_health_check():
+    # One client reuses its pooled keep-alive connections across all requests
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        await run_tests(client)
+
+    print("\n" + "=" * 60)
+    print("✅ Tests complete!")
+    print("=" * 60)
+    print("\n📚 Visit http://localhost:8000/docs for interactive API documentation")
+
+
+async def run_tests(client: httpx.AsyncClient):
+    """Run the test sequence against a running server"""
+    # Tests 1-2: Health check and existing searches are independent, so probe both at once
+    healthy, _ = await asyncio.gather(
+        check_health(client),
+        check_list_searches(client)
+    )
+    if not healthy:
         print("\n⚠️  Server is not running. Please start it first:")
         print("   cd backend && python run.py")
         return
 
-    # Test 2: List existing searches
-    test_list_searches()
-
     # Test 3: Create a new search (optional - requires Exa API key)
     print("\n" + "=" * 60)
     print("📝 Note: Creating a search requires a valid EXA_API_KEY in .env")
@@ -156,21 +171,17 @@ def main():
     create_search = input("\nDo you want to create a test search? (y/n): ").lower()
 
     if create_search == 'y':
-        search_id = test_create_search()
+        search_id = await check_create_search(client)
 
         if search_id:
-            # Test 4: Get search status
-            time.sleep(2)  # Wait a bit
-            test_get_search_status(search_id)
+            await asyncio.sleep(2)  # Wait a bit
 
-            # Test 5: Get candidates
-            test_get_candidates()
-
-    print("\n" + "=" * 60)
-    print("✅ Tests complete!")
-    print("=" * 60)
-    print("\n📚 Visit http://localhost:8000/docs for interactive API documentation")
+            # Tests 4-5: Search status and candidates
+            await asyncio.gather(
+                check_get_search_status(client, search_id),
+                check_get_candidates(client)
+            )
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
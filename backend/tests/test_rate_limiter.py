@@ -0,0 +1,155 @@
+"""
+Tests for the adaptive Exa rate limiter
+"""
+from unittest import mock
+import asyncio
+import unittest
+
+from app.core import rate_limiter
+from app.core.rate_limiter import RateLimiter, _retry_after, call_with_rate_limit
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code: int, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = FakeResponse(status_code, headers)
+
+
+class FakeSDKCall:
+    """Blocking SDK call that raises the queued errors before succeeding"""
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class RateLimiterTestCase(unittest.IsolatedAsyncioTestCase):
+    """Runs each test on a fake clock and records every limiter sleep"""
+
+    async def asyncSetUp(self):
+        self.now = 1000.0
+        self.delays = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay):
+            self.delays.append(delay)
+            self.now += delay
+            await real_sleep(0)
+
+        clock = mock.Mock(monotonic=lambda: self.now)
+        patches = [
+            mock.patch.object(rate_limiter, "time", clock),
+            mock.patch.object(rate_limiter.asyncio, "sleep", fake_sleep),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+
+class RetryAfterTests(unittest.TestCase):
+
+    def test_reads_retry_after_header(self):
+        self.assertEqual(_retry_after(FakeAPIError(429, {"Retry-After": "2.5"})), 2.5)
+
+    def test_missing_or_invalid_header_is_zero(self):
+        self.assertEqual(_retry_after(FakeAPIError(429)), 0.0)
+        self.assertEqual(_retry_after(FakeAPIError(429, {"Retry-After": "soon"})), 0.0)
+
+    def test_other_errors_are_not_throttling(self):
+        self.assertIsNone(_retry_after(FakeAPIError(500)))
+        self.assertIsNone(_retry_after(ValueError("webset 429 not found")))
+
+
+class CallWithRateLimitTests(RateLimiterTestCase):
+
+    async def test_429_with_retry_after_waits_for_the_header_delay(self):
+        limiter = RateLimiter(rate=4.0)
+        call = FakeSDKCall(FakeAPIError(429, {"Retry-After": "3"}))
+
+        self.assertEqual(await call_with_rate_limit(limiter, call), "ok")
+
+        self.assertEqual(call.calls, 2)
+        self.assertEqual(self.delays, [3.0])
+        self.assertEqual(limiter.rate, 2.0)
+
+    async def test_429_without_retry_after_waits_for_the_halved_rate(self):
+        limiter = RateLimiter(rate=4.0)
+        call = FakeSDKCall(FakeAPIError(429))
+
+        self.assertEqual(await call_with_rate_limit(limiter, call), "ok")
+
+        self.assertEqual(call.calls, 2)
+        # One token at the halved rate of 2 requests per second
+        self.assertEqual(len(self.delays), 1)
+        self.assertAlmostEqual(self.delays[0], 0.5)
+
+    async def test_gives_up_after_max_retries(self):
+        limiter = RateLimiter(rate=4.0)
+        call = FakeSDKCall(*(FakeAPIError(429) for _ in range(5)))
+
+        with self.assertRaises(FakeAPIError):
+            await call_with_rate_limit(limiter, call, max_retries=2)
+
+        self.assertEqual(call.calls, 3)
+        self.assertEqual(limiter.rate, 1.0)
+
+    async def test_other_errors_are_not_retried(self):
+        limiter = RateLimiter(rate=4.0)
+        call = FakeSDKCall(FakeAPIError(500))
+
+        with self.assertRaises(FakeAPIError):
+            await call_with_rate_limit(limiter, call)
+
+        self.assertEqual(call.calls, 1)
+        self.assertEqual(limiter.rate, 4.0)
+        self.assertEqual(self.delays, [])
+
+
+class RecoveryTests(RateLimiterTestCase):
+
+    async def test_rate_recovers_after_ten_successes(self):
+        limiter = RateLimiter(rate=4.0, max_rate=4.2)
+        limiter.record_throttled()
+        self.assertEqual(limiter.rate, 2.0)
+
+        for _ in range(9):
+            limiter.record_success()
+        self.assertEqual(limiter.rate, 2.0)
+        limiter.record_success()
+        self.assertAlmostEqual(limiter.rate, 2.2)
+
+        for _ in range(100):
+            limiter.record_success()
+        self.assertEqual(limiter.rate, 4.2)
+
+    async def test_throttling_resets_the_success_streak(self):
+        limiter = RateLimiter(rate=4.0)
+        for _ in range(9):
+            limiter.record_success()
+        limiter.record_throttled()
+        limiter.record_success()
+
+        self.assertEqual(limiter.rate, 2.0)
+
+    async def test_rate_never_drops_below_min_rate(self):
+        limiter = RateLimiter(rate=1.0, min_rate=0.5)
+        for _ in range(5):
+            limiter.record_throttled()
+
+        self.assertEqual(limiter.rate, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()